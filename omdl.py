@@ -7,22 +7,39 @@ import json
 import os
 import pickle
 import re
+import csv
+import functools
+import hashlib
+import threading
+import io
+import zipfile
+import weakref
 
 from typing import Dict, Any, Tuple, List
 from pathlib import Path
-from queue import Queue
-from threading import Thread, Event
+from types import SimpleNamespace
+from queue import Queue, Empty, Full
+from collections import OrderedDict, deque, namedtuple
+from threading import Thread, Event, Lock
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.common.action_chains import ActionChains
-from collections import deque
+from openpyxl.cell import WriteOnlyCell
 from datetime import datetime
+from xml.sax.saxutils import escape, quoteattr
 from google_auth_oauthlib.flow import InstalledAppFlow
 from google.auth.transport.requests import Request
 from googleapiclient.discovery import build
 from googleapiclient.errors import HttpError
+from googleapiclient.http import build_http
+from google_auth_httplib2 import AuthorizedHttp
+
+try:
+    import orjson  # optional, much faster JSON serialization
+except ImportError:
+    orjson = None
 
 ##### PROJECT INFO
 PROJECT_NAME = "OMDL (Oh My DataLayer)"
@@ -43,26 +60,113 @@ Documentation: {PROJECT_URL}
 {'='*60}
 """
 
-allowed_validation_types = {'<int>', '<float>', '<str>', '<bool>'}
+_random_state = threading.local()  # a generator of the current sequence in each thread, set with random_seed
+
+def random_choice(population):
+    """Random pick for user agents and URLs - from the sequence's own generator when random_seed is set"""
+    return getattr(_random_state, 'generator', random).choice(population)
+
+def random_sample(population, k):
+    """Random candidate elements - from the sequence's own generator when random_seed is set"""
+    return getattr(_random_state, 'generator', random).sample(population, k)
+
+def seed_sequence_random(config, sequence_name):
+    """
+    Give the current thread a generator seeded with random_seed and the sequence name, so each sequence makes the
+    same choices in every run, also when sequences run in parallel and share the global generator
+    """
+    random_seed = config['config'].get('random_seed')
+    if random_seed is not None:
+        _random_state.generator = random.Random(f"{random_seed}:{sequence_name}")
+
+allowed_validation_types = frozenset(('<int>', '<float>', '<str>', '<bool>'))
+
+# Output layout - built once and shared by all sheets (openpyxl styles are immutable)
+WRAP_ALIGNMENT = openpyxl.styles.Alignment(wrapText=True)
+WRAP_STYLE_NAME = 'wrap_cell'  # named style registered once per workbook, cells only reference it by name
+
+SEQUENCE_HEADERS = ("Step", "Event", "Timestamp", "URL", "Event Data", "Valid", "Error Details")
+SEQUENCE_COLUMN_WIDTHS = (
+    ('A', 20),  # Step
+    ('B', 20),  # Event
+    ('C', 20),  # Timestamp
+    ('D', 50),  # URL
+    ('E', 100), # Event Data
+    ('F', 20),  # Valid
+    ('G', 100), # Error Details
+)
+
+# First characters that make Excel treat a cell as a formula
+EXCEL_FORMULA_TRIGGERS = frozenset(('=', '+', '-', '@', '\t'))
+
+EXCEL_WIDTH_PIXELS = 7  # approximate width of one Excel column width unit in pixels, for Google Sheets
+
+DEBUG_LOG_HEADERS = ("Timestamp", "Level", "Message")
+DEBUG_LOG_COLUMN_WIDTHS = (
+    ('A', 20),  # Timestamp
+    ('B', 10),  # Level
+    ('C', 150), # Message
+)
 
 ##### CLASSES
 
 class LogCollector:
     """Collect log messages with timestamps for debugging"""
-    def __init__(self, console_levels=("INFO", "WARNING", "ERROR")):
-        self.logs = deque()  # deque seems to be better large logs
+    def __init__(self, console_levels=("INFO", "WARNING", "ERROR"), max_entries=None):
+        self.logs = self._new_store([], max_entries)
+        self.collect = True  # turned off when debug logs won't be saved - then only console messages are handled
         self.console_levels = console_levels
+
+    def log(self, message, *args, level="DEBUG"):
+        """
+        Add a log message, timestamp and level.
+        With args, the message is a %-format string, formatted only when the entry is actually kept or printed
+        (level is keyword-only, so it can't be taken for one of them).
+        The timestamp is kept as a number and only formatted in get_logs().
+        """
+        to_console = level in self.console_levels
+        if not (self.collect or to_console):
+            return
+        if args:
+            message = message % args
+        if not self.collect:
+            print(message)
+            return
         
-    def log(self, message, level="DEBUG"):
-        """Add a log message, timestamp and level"""
-        timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-        self.logs.append([timestamp, level, message])
-        if level in self.console_levels:
+        # Steps, monitoring threads and parallel sequences log concurrently - a single append of a ready tuple
+        # to a list or deque is atomic in CPython, so no lock is needed
+        self.logs.append((time.time(), level, message))
+        if to_console:
             print(message)
+    
+    @staticmethod
+    def _new_store(entries, max_entries):
+        """With a limit, a deque that drops the oldest entries - otherwise a plain list, cheaper to append to"""
+        return deque(entries, maxlen=max_entries) if max_entries else list(entries)
+    
+    def set_max_entries(self, max_entries):
+        """
+        Limit the number of kept entries, 0 or None for no limit (the limit is only known once the config is loaded).
+        Call it before other threads start logging - entries appended while the store is replaced could be lost.
+        """
+        self.logs = self._new_store(self.logs, max_entries)
         
     def get_logs(self):
-        """Return all logs"""
-        return list(self.logs)
+        """Return a snapshot of all logs as (timestamp, level, message), with formatted timestamps"""
+        entries = list(self.logs)  # copied in C without releasing the GIL, so concurrent appends can't interleave
+        
+        # Timestamps have 1-second resolution, so the formatted string is reused within the same second
+        logs = []
+        append = logs.append
+        last_second = None
+        timestamp = ''
+        for created, level, message in entries:
+            second = int(created)
+            if second != last_second:
+                timestamp = time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(second))
+                last_second = second
+            append((timestamp, level, message))
+        return logs
 
 class ExcelWriter:
     """Write data to Excel"""
@@ -75,99 +179,293 @@ class ExcelWriter:
     def save_data(self, log_data, debug_logs=None):
         """Save data to an Excel file"""
         try:
-            # Start a workbook and set up file parameters
-            self.workbook = openpyxl.Workbook()
+            # Start a write-only workbook (rows are streamed, not kept as Cell objects) and set up file parameters
+            cfg = self.config['config']
+            self.workbook = openpyxl.Workbook(write_only=True)
             timestamp = datetime.now().strftime('%Y-%m-%d_%H-%M-%S')
-            base_filename = self.config['config'].get('title', 'datalayer')
+            base_filename = cfg.get('title', 'datalayer')
             output_folder = get_output_folder(self.config, self.logger)
             self.output_path = output_folder / f'{base_filename}_{timestamp}.xlsx'
             
-            # Write each sequence to a separate sheet
-            first_sequence = True
-            for sequence_name, sequence_data in log_data.items():
-                if first_sequence:
-                    sheet = self.workbook.active
-                    sheet.title = sequence_name[:31]
-                    first_sequence = False
-                else:
-                    sheet = self.workbook.create_sheet(title=sequence_name[:31])
-                
+            # Rows are streamed to disk as they are appended; with lxml installed openpyxl uses its incremental xmlfile writer
+            if not openpyxl.LXML:
+                self.logger.log("lxml not installed - Excel rows will be written with the slower built-in XML backend")
+            
+            # Write each sequence to a separate sheet (write-only workbooks have no default sheet)
+            for sequence_name, sequence_data in log_data:
+                sheet = self.workbook.create_sheet(title=sequence_name[:31])
                 self._write_sequence_data(sheet, sequence_data)
             
             # Add debug logs if enabled
-            if debug_logs and self.config['config'].get('debug_mode', False):
-                self.logger.log("Creating debug log sheet...")
-                debug_sheet = self.workbook.create_sheet(title="debug_log")
-                self._write_debug_logs(debug_sheet, debug_logs)
+            if debug_logs and cfg.get('debug_mode', False):
+                # Very long logs go to a separate CSV file - much cheaper to write than an Excel sheet
+                if len(debug_logs) > cfg.get('debug_log_csv_threshold', 10000):
+                    debug_log_path = output_folder / f'{base_filename}_debuglog_{timestamp}.csv'
+                    self._write_debug_logs_csv(debug_log_path, debug_logs)
+                    self.logger.log(f"Debug logs saved to: {debug_log_path}", level="INFO")
+                else:
+                    self.logger.log("Creating debug log sheet...")
+                    debug_sheet = self.workbook.create_sheet(title="debug_log")
+                    self._write_debug_logs(debug_sheet, debug_logs)
             
             # Save workbook
             self.workbook.save(self.output_path)
-            # self.logger.log(f"Data successfully saved to Excel: {self.output_path}", "INFO")
+            # self.logger.log(f"Data successfully saved to Excel: {self.output_path}", level="INFO")
             return str(self.output_path)
             
         except Exception as e:
             error_msg = f"Failed to save to Excel: {str(e)}"
-            self.logger.log(error_msg, "ERROR")
+            self.logger.log(error_msg, level="ERROR")
             raise Exception(error_msg)
     
     def _write_sequence_data(self, sheet, data):
-        """Write sequence data to a sheet"""
-        
-        # Headers
-        headers = ["Step", "Event", "Timestamp", "URL", "Event Data", "Valid", "Error Details"]
-        sheet.append(headers)
+        """Write sequence data to a sheet - data can be any iterable of rows, including a generator"""
         
-        # Set column & row sizes
-        sheet.column_dimensions['A'].width = 20  # Step
-        sheet.column_dimensions['B'].width = 20  # Event
-        sheet.column_dimensions['C'].width = 20  # Timestamp
-        sheet.column_dimensions['D'].width = 50  # URL
-        sheet.column_dimensions['E'].width = 100  # Event Data
-        sheet.column_dimensions['F'].width = 20  # Valid
-        sheet.column_dimensions['G'].width = 100  # Error Details
+        # Set column & row sizes - in write-only mode they must be set before the first row is appended
+        for column, width in SEQUENCE_COLUMN_WIDTHS:
+            sheet.column_dimensions[column].width = width
         
         sheet.sheet_format.defaultRowHeight = 20 # Default row height for all rows
         sheet.row_dimensions[1].height = 15 # Header row height
         
-        # Write data
-        for entry in data:
-            sheet.append(list(entry))
+        # Headers
+        sheet.append(SEQUENCE_HEADERS)
         
-        # Apply text wrapping to Event Data column
-        for row in sheet.iter_rows(min_row=2, min_col=5, max_col=5):
-            for cell in row:
-                cell.alignment = openpyxl.styles.Alignment(wrapText=False)
+        # Write data (Event Data is left unwrapped, which is the default alignment)
+        append = sheet.append
+        for entry in data:
+            append(entry)  # rows are lists or tuples, both accepted by write-only sheets as they are
     
     def _write_debug_logs(self, sheet, debug_logs):
         """If enabled, write debug logs to an additional sheet"""
         
-        # Write headers
-        headers = ["Timestamp", "Level", "Message"]
-        sheet.append(headers)
-        
         # Set column & row sizes
-        sheet.column_dimensions['A'].width = 20  # Timestamp
-        sheet.column_dimensions['B'].width = 10  # Level
-        sheet.column_dimensions['C'].width = 150  # Message
+        for column, width in DEBUG_LOG_COLUMN_WIDTHS:
+            sheet.column_dimensions[column].width = width
         sheet.sheet_format.defaultRowHeight = 20 # Default row height for all rows
         
-        # Add logs
-        for log in debug_logs:
-            formatted_row = []
-            for item in log:
-                cell_value = str(item)
-                # If cell starts with =, +, -, @, tab, or has common Excel triggers
-                if cell_value.startswith(('=', '+', '-', '@', '\t')) or ',,' in cell_value:
-                    # Prefix with single quote to force text format
-                    cell_value = f"'{cell_value}"
-                formatted_row.append(cell_value)
-            sheet.append(formatted_row)
+        # Wrap the Message column - the column style covers empty cells, the named style the written ones
+        if WRAP_STYLE_NAME not in self.workbook.named_styles:
+            self.workbook.add_named_style(openpyxl.styles.NamedStyle(name=WRAP_STYLE_NAME, alignment=WRAP_ALIGNMENT))
+        sheet.column_dimensions['C'].alignment = WRAP_ALIGNMENT
+        
+        # Write headers
+        sheet.append(DEBUG_LOG_HEADERS)
+        
+        # Add logs - timestamp and level are always plain strings generated by LogCollector,
+        # so only the free-text message needs to be checked for Excel formula triggers
+        append = sheet.append
+        as_text = self._as_text
+        for timestamp, level, message in debug_logs:
+            message = as_text(message)
+            
+            # Style the Message cell while appending, instead of walking the sheet again afterwards
+            message_cell = WriteOnlyCell(sheet, value=message)
+            message_cell.style = WRAP_STYLE_NAME
+            message_cell.data_type = 's'
+            append([timestamp, level, message_cell])
+    
+    def _write_debug_logs_csv(self, path, debug_logs):
+        """Write debug logs to a CSV file, used instead of the debug sheet for very long logs"""
+        with open(path, 'w', newline='', encoding='utf-8-sig') as file:  # BOM so that Excel detects UTF-8
+            writer = csv.writer(file, quoting=csv.QUOTE_ALL)
+            writer.writerow(DEBUG_LOG_HEADERS)
+            as_text = self._as_text
+            writer.writerows((timestamp, level, as_text(message)) for timestamp, level, message in debug_logs)
+    
+    @staticmethod
+    def _as_text(message):
+        """Convert a log message to text that Excel won't interpret as a formula"""
+        if not isinstance(message, str):
+            message = str(message)
+        if message[:1] in EXCEL_FORMULA_TRIGGERS or ',,' in message:
+            # Prefix with single quote to force text format
+            message = f"'{message}"
+        return message
+
+# Package parts of a minimal .xlsx file, used by FastXlsxWriter
+XLSX_CONTENT_TYPES = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+    '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+    '<Default Extension="xml" ContentType="application/xml"/>'
+    '<Override PartName="/xl/workbook.xml" ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet.main+xml"/>'
+    '<Override PartName="/xl/styles.xml" ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.styles+xml"/>'
+    '{sheets}'
+    '</Types>'
+)
+XLSX_SHEET_CONTENT_TYPE = '<Override PartName="/xl/worksheets/sheet{index}.xml" ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.worksheet+xml"/>'
+XLSX_ROOT_RELS = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+    '<Relationship Id="rId1" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument" Target="xl/workbook.xml"/>'
+    '</Relationships>'
+)
+XLSX_WORKBOOK = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<workbook xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main" '
+    'xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships">'
+    '<sheets>{sheets}</sheets>'
+    '</workbook>'
+)
+XLSX_WORKBOOK_SHEET = '<sheet name={name} sheetId="{index}" r:id="rId{index}"/>'
+XLSX_WORKBOOK_RELS = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+    '{sheets}'
+    '<Relationship Id="rId{styles_index}" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/styles" Target="styles.xml"/>'
+    '</Relationships>'
+)
+XLSX_WORKBOOK_SHEET_REL = '<Relationship Id="rId{index}" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/worksheet" Target="worksheets/sheet{index}.xml"/>'
+XLSX_STYLES = (  # style 0 - default, style 1 - wrapped text
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<styleSheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">'
+    '<fonts count="1"><font><sz val="11"/><name val="Calibri"/></font></fonts>'
+    '<fills count="2"><fill><patternFill patternType="none"/></fill><fill><patternFill patternType="gray125"/></fill></fills>'
+    '<borders count="1"><border><left/><right/><top/><bottom/><diagonal/></border></borders>'
+    '<cellStyleXfs count="1"><xf numFmtId="0" fontId="0" fillId="0" borderId="0"/></cellStyleXfs>'
+    '<cellXfs count="2"><xf numFmtId="0" fontId="0" fillId="0" borderId="0" xfId="0"/>'
+    '<xf numFmtId="0" fontId="0" fillId="0" borderId="0" xfId="0" applyAlignment="1"><alignment wrapText="1"/></xf></cellXfs>'
+    '<cellStyles count="1"><cellStyle name="Normal" xfId="0" builtinId="0"/></cellStyles>'
+    '</styleSheet>'
+)
+XLSX_SHEET_START = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<worksheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">'
+    '<sheetFormatPr defaultRowHeight="20" customHeight="1"/>'
+    '<cols>{cols}</cols>'
+    '<sheetData>'
+)
+XLSX_SHEET_END = '</sheetData></worksheet>'
+XLSX_WRAP_STYLE = 1
+XML_ILLEGAL_CHARACTERS = re.compile(r'[\x00-\x08\x0b\x0c\x0e-\x1f]')  # not allowed in XML 1.0, dropped from cell text
+SHEET_TITLE_INVALID_CHARACTERS = re.compile(r'[\\*?:/\[\]]')
+
+class FastXlsxWriter(ExcelWriter):
+    """Write data to Excel by generating the sheet XML directly - no openpyxl cell objects on the row path"""
+    
+    def save_data(self, log_data, debug_logs=None):
+        """Save data to an Excel file"""
+        try:
+            cfg = self.config['config']
+            timestamp = datetime.now().strftime('%Y-%m-%d_%H-%M-%S')
+            base_filename = cfg.get('title', 'datalayer')
+            output_folder = get_output_folder(self.config, self.logger)
+            self.output_path = output_folder / f'{base_filename}_{timestamp}.xlsx'
+            
+            sheet_titles = []
+            with zipfile.ZipFile(self.output_path, 'w', zipfile.ZIP_DEFLATED) as archive:
+                # Write each sequence to a separate sheet, streamed straight into the archive
+                for sequence_name, sequence_data in log_data:
+                    with self._open_sheet(archive, sheet_titles, sequence_name, SEQUENCE_COLUMN_WIDTHS) as sheet:
+                        self._write_sequence_data(sheet, sequence_data)
+                
+                # Add debug logs if enabled
+                if debug_logs and cfg.get('debug_mode', False):
+                    # Very long logs go to a separate CSV file - much cheaper to write than an Excel sheet
+                    if len(debug_logs) > cfg.get('debug_log_csv_threshold', 10000):
+                        debug_log_path = output_folder / f'{base_filename}_debuglog_{timestamp}.csv'
+                        self._write_debug_logs_csv(debug_log_path, debug_logs)
+                        self.logger.log(f"Debug logs saved to: {debug_log_path}", level="INFO")
+                    else:
+                        self.logger.log("Creating debug log sheet...")
+                        with self._open_sheet(archive, sheet_titles, "debug_log", DEBUG_LOG_COLUMN_WIDTHS, wrapped_column='C') as sheet:
+                            self._write_debug_logs(sheet, debug_logs)
+                
+                self._write_package_parts(archive, sheet_titles)
+            
+            return str(self.output_path)
+            
+        except Exception as e:
+            error_msg = f"Failed to save to Excel: {str(e)}"
+            self.logger.log(error_msg, level="ERROR")
+            raise Exception(error_msg)
+    
+    def _open_sheet(self, archive, sheet_titles, title, column_widths, wrapped_column=None):
+        """Add a worksheet part to the archive and return it as a text stream, positioned inside <sheetData>"""
+        title = SHEET_TITLE_INVALID_CHARACTERS.sub('_', title)[:31]  # Sheet names are limited to 31 chars
+        base_title, suffix = title, 1
+        while title.lower() in (existing.lower() for existing in sheet_titles):  # same renaming as openpyxl.create_sheet
+            title = f"{base_title[:31 - len(str(suffix))]}{suffix}"
+            suffix += 1
+        sheet_titles.append(title)
+        
+        cols = []
+        for column, width in column_widths:
+            index = openpyxl.utils.column_index_from_string(column)
+            style = f' style="{XLSX_WRAP_STYLE}"' if column == wrapped_column else ''
+            cols.append(f'<col min="{index}" max="{index}" width="{width}" customWidth="1"{style}/>')
+        
+        sheet = io.TextIOWrapper(archive.open(f'xl/worksheets/sheet{len(sheet_titles)}.xml', 'w'), encoding='utf-8')
+        sheet.write(XLSX_SHEET_START.format(cols=''.join(cols)))
+        return _XlsxSheetStream(sheet)
+    
+    def _write_sequence_data(self, sheet, data):
+        """Write sequence data to a sheet - data can be any iterable of rows, including a generator"""
+        sheet.write_row(SEQUENCE_HEADERS, height=15)  # Header row height
+        
+        # Write data (Event Data is left unwrapped, which is the default alignment)
+        write_row = sheet.write_row
+        for entry in data:
+            write_row(entry)
+    
+    def _write_debug_logs(self, sheet, debug_logs):
+        """If enabled, write debug logs to an additional sheet"""
+        sheet.write_row(DEBUG_LOG_HEADERS)
         
-        # Apply text wrapping to Message column
-        for row in sheet.iter_rows(min_row=2, min_col=3, max_col=3):
-            for cell in row:
-                cell.alignment = openpyxl.styles.Alignment(wrapText=True)
-                cell.data_type = 's'
+        # Inline strings are never formulas, but messages get the same quote prefix as in the openpyxl writer
+        write_row = sheet.write_row
+        as_text = self._as_text
+        for timestamp, level, message in debug_logs:
+            write_row((timestamp, level, as_text(message)), wrapped_index=2)
+    
+    def _write_package_parts(self, archive, sheet_titles):
+        """Write the workbook, relationship, content type and style parts for the written sheets"""
+        indexes = range(1, len(sheet_titles) + 1)
+        archive.writestr('[Content_Types].xml', XLSX_CONTENT_TYPES.format(
+            sheets=''.join(XLSX_SHEET_CONTENT_TYPE.format(index=index) for index in indexes)))
+        archive.writestr('_rels/.rels', XLSX_ROOT_RELS)
+        archive.writestr('xl/workbook.xml', XLSX_WORKBOOK.format(
+            sheets=''.join(XLSX_WORKBOOK_SHEET.format(name=quoteattr(title), index=index)
+                           for index, title in zip(indexes, sheet_titles))))
+        archive.writestr('xl/_rels/workbook.xml.rels', XLSX_WORKBOOK_RELS.format(
+            sheets=''.join(XLSX_WORKBOOK_SHEET_REL.format(index=index) for index in indexes),
+            styles_index=len(sheet_titles) + 1))
+        archive.writestr('xl/styles.xml', XLSX_STYLES)
+
+class _XlsxSheetStream:
+    """Row writer for a worksheet part opened by FastXlsxWriter"""
+    def __init__(self, stream):
+        self.stream = stream
+        self.row_number = 0
+    
+    def write_row(self, values, height=None, wrapped_index=None):
+        """Write one row - strings as inline strings, numbers and booleans as values, None as an empty cell"""
+        self.row_number += 1
+        height_attrs = f' ht="{height}" customHeight="1"' if height else ''
+        cells = []
+        for index, value in enumerate(values):
+            style = f' s="{XLSX_WRAP_STYLE}"' if index == wrapped_index else ''
+            if value is None:
+                cells.append(f'<c{style}/>')
+            elif isinstance(value, bool):
+                cells.append(f'<c t="b"{style}><v>{int(value)}</v></c>')
+            elif isinstance(value, (int, float)):
+                cells.append(f'<c{style}><v>{value}</v></c>')
+            else:
+                text = escape(XML_ILLEGAL_CHARACTERS.sub('', str(value)))
+                cells.append(f'<c t="inlineStr"{style}><is><t xml:space="preserve">{text}</t></is></c>')
+        self.stream.write(f'<row r="{self.row_number}"{height_attrs}>{"".join(cells)}</row>')
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc_info):
+        self.stream.write(XLSX_SHEET_END)
+        self.stream.close()
+
+# (credentials path, token path) pairs that passed GoogleSheetsAuth._validate_paths in this process
+_VALIDATED_AUTH_PATHS = set()
 
 class GoogleSheetsAuth:
     """Google Sheets authentication using OAuth 2.0"""
@@ -179,6 +477,7 @@ class GoogleSheetsAuth:
         self.config = config
         self.logger = logger
         self.credentials = None
+        self.http = None
         
         # Get Google Sheets config from the TOML file (config.google_sheets)
         self.gs_config = self.config['config'].get('google_sheets', {})
@@ -195,14 +494,14 @@ class GoogleSheetsAuth:
             if not path:
                 raise ValueError("GOOGLE_SHEETS_CREDENTIALS_PATH environment variable not set")
             self.logger.log("Using credentials path from environment variable")
-            return path
+            return Path(path)
         else:
             # Default to file-based configuration
-            path = self.gs_config.get('credentials_path', 'credentials.json')
+            path = Path(self.gs_config.get('credentials_path', 'credentials.json'))
             # If relative path, make it relative to config file location
-            if not os.path.isabs(path):
-                config_dir = os.path.dirname(os.path.abspath(self.config['_config_file_path']))
-                path = os.path.join(config_dir, path)
+            if not path.is_absolute():
+                config_dir = Path(self.config['_config_file_path']).resolve().parent
+                path = config_dir / path
             self.logger.log(f"Using credentials path from config: {path}")
             return path
             
@@ -213,44 +512,48 @@ class GoogleSheetsAuth:
             if not path:
                 raise ValueError("GOOGLE_SHEETS_TOKEN_PATH environment variable not set")
             self.logger.log("Using token path from environment variable")
-            return path
+            return Path(path)
         else:
             # Default to file-based configuration - same directory as credentials
-            creds_dir = os.path.dirname(self.credentials_path)
-            path = os.path.join(creds_dir, 'token.pickle')
+            path = self.credentials_path.parent / 'token.pickle'
             self.logger.log(f"Using token path: {path}")
             return path
             
     def _validate_paths(self):
         """Validate that credential paths exist and are accessible"""
+        key = (self.credentials_path, self.token_path)
+        if key in _VALIDATED_AUTH_PATHS:  # already checked in this process
+            return
+        
         # Check credentials.json
-        if not os.path.exists(self.credentials_path):
+        if not self.credentials_path.exists():
             raise FileNotFoundError(
                 f"Credentials file not found at: {self.credentials_path}\n"
                 "If you don't have the credentials.json file, please follow the setup instructions to configure Google Sheets integration."
             )
             
         # Check token directory is writable if token doesn't exist yet
-        token_dir = os.path.dirname(self.token_path)
-        if not os.path.exists(self.token_path):
-            if not os.path.exists(token_dir):
-                try:
-                    os.makedirs(token_dir)
-                except Exception as e:
-                    raise PermissionError(
-                        f"Cannot create token directory at: {token_dir}\n"
-                        f"Error: {str(e)}"
-                    )
-            elif not os.access(token_dir, os.W_OK):
+        token_dir = self.token_path.parent
+        if not self.token_path.exists():
+            # mkdir with exist_ok is a no-op for existing directories, so no separate exists() check is needed
+            try:
+                token_dir.mkdir(parents=True, exist_ok=True)
+            except OSError as e:
+                raise PermissionError(
+                    f"Cannot create token directory at: {token_dir}\n"
+                    f"Error: {str(e)}"
+                )
+            if not os.access(token_dir, os.W_OK):
                 raise PermissionError(
                     f"Token directory is not writable: {token_dir}\n"
                     "Please ensure you have write permissions."
                 )
+        _VALIDATED_AUTH_PATHS.add(key)
         
     def authenticate(self):
         """OAuth authentication flow"""
         try:
-            if os.path.exists(self.token_path):
+            if self.token_path.exists():
                 with open(self.token_path, 'rb') as token:
                     self.credentials = pickle.load(token)
                     
@@ -260,27 +563,49 @@ class GoogleSheetsAuth:
                     self.logger.log("Refreshing Google Sheets access token...")
                     self.credentials.refresh(Request())
                 else:
-                    self.logger.log("Starting new Google Sheets authentication flow...", "INFO")
+                    self.logger.log("Starting new Google Sheets authentication flow...", level="INFO")
                     flow = InstalledAppFlow.from_client_secrets_file(
-                        self.credentials_path,
+                        str(self.credentials_path),
                         self.SCOPES
                     )
                     self.credentials = flow.run_local_server(port=0)
                     
                 # Save the credentials
-                token_dir = os.path.dirname(self.token_path)
-                if not os.path.exists(token_dir):
-                    os.makedirs(token_dir)
+                self.token_path.parent.mkdir(parents=True, exist_ok=True)
                     
                 with open(self.token_path, 'wb') as token:
                     pickle.dump(self.credentials, token)
-            self.service = build('sheets', 'v4', credentials=self.credentials)
+            # One authorized HTTP client (with its kept-alive connections) is shared by all Google API services
+            self.http = AuthorizedHttp(self.credentials, http=build_http())
+            # Discovery documents are bundled with the client library; skip the file cache lookup
+            self.service = build('sheets', 'v4', http=self.http, cache_discovery=False)
             return self.service        
             
         except Exception as e:
-            self.logger.log(f"Authentication error: {str(e)}", "ERROR")
+            self.logger.log(f"Authentication error: {str(e)}", level="ERROR")
             raise        
     
+# Authorized Google API clients, shared by all writers in the process:
+# (config file path, Google Sheets settings) -> (credentials, authorized HTTP client, Sheets service)
+_GOOGLE_SERVICES = {}
+_GOOGLE_SERVICES_LOCK = Lock()
+
+def get_google_services(config, logger):
+    """Return credentials, HTTP client and Sheets service, authenticating only if there are no valid cached ones"""
+    gs_config = config['config'].get('google_sheets', {})
+    key = (config.get('_config_file_path'), tuple(sorted((name, str(value)) for name, value in gs_config.items())))
+    with _GOOGLE_SERVICES_LOCK:
+        cached = _GOOGLE_SERVICES.get(key)
+        if cached is not None and cached[0].valid:
+            return cached
+        # Paths are validated and the token file is read only here, on the first use (or after the token expired)
+        auth = GoogleSheetsAuth(config, logger)
+        auth.authenticate()
+        _GOOGLE_SERVICES[key] = (auth.credentials, auth.http, auth.service)
+        return _GOOGLE_SERVICES[key]
+
+SHEETS_WRITE_CHUNK_ROWS = 5000  # rows per values.update - keeps a request of long JSON cells well below the size limit
+
 class GoogleSheetsWriter:
     """Writing data to Google Sheets"""
     
@@ -289,292 +614,268 @@ class GoogleSheetsWriter:
         self.logger = logger
         self.spreadsheet_id = None
         self.service = None
+        self.credentials = None
+        self.http = None
         self.spreadsheet_url = None
+        self._drive_service = None
         
     def save_data(self, log_data, debug_logs=None):
         """Main method to save data to Google Sheets"""
         try:
-            # Initialize authentication
-            auth = GoogleSheetsAuth(self.config, self.logger)
-            auth.authenticate()
-            self.service = auth.service
+            # Get authorized services - authentication runs once per process, repeated saves reuse it
+            # (credentials and HTTP client are reused for the Drive API, no second authentication)
+            credentials, http, service = get_google_services(self.config, self.logger)
+            if http is not self.http:
+                self._drive_service = None  # it was built on the previous HTTP client
+            self.credentials, self.http, self.service = credentials, http, service
+            cfg = self.config['config']
+            gs_config = cfg.get('google_sheets', {})
+            
+            # Collect all sheets up front, so they can be written with a fixed number of API calls
+            sheets = []  # (title, headers, column widths, rows)
+            for sequence_name, sequence_data in log_data:
+                sheets.append((sequence_name[:31], SEQUENCE_HEADERS, SEQUENCE_COLUMN_WIDTHS, list(sequence_data)))  # Sheet names are limited to 31 chars
+            
+            # Add debug logs if enabled
+            if debug_logs and cfg.get('debug_mode', False):
+                sheets.append(("debug_log", DEBUG_LOG_HEADERS, DEBUG_LOG_COLUMN_WIDTHS, list(debug_logs)))
             
-            # Create new spreadsheet
             timestamp = datetime.now().strftime('%Y-%m-%d_%H-%M-%S')
-            base_filename = self.config['config'].get('title', 'datalayer')
+            base_filename = cfg.get('title', 'datalayer')
             sheet_title = f"{base_filename}_{timestamp}"
             
             self.logger.log(f"Creating Google Sheet: {sheet_title}")
-            spreadsheet = self.service.spreadsheets().create(
-                body={'properties': {'title': sheet_title}}
-            ).execute()
-            self.spreadsheet_id = spreadsheet['spreadsheetId']
-
-            # Move to folder if a directory is specified
-            if 'folder_id' in self.config['config'].get('google_sheets', {}):
-                self.logger.log("Moving spreadsheet to a specified folder")
-                self._move_to_folder()
+            requests = []
+            folder_id = gs_config.get('folder_id')
+            self.spreadsheet_id = self._create_in_folder(sheet_title, folder_id) if folder_id else None
+            if self.spreadsheet_id:
+                # A file created with Drive has a default sheet - add ours and remove it in the same batchUpdate as the data
+                default_sheet_ids = self._get_sheet_ids()
+                first_sheet_id = max(default_sheet_ids, default=0) + 1
+                sheet_ids = list(range(first_sheet_id, first_sheet_id + len(sheets)))
+                for sheet_id, (title, headers, _, rows) in zip(sheet_ids, sheets):
+                    requests.append({'addSheet': {'properties': self._sheet_properties(title, headers, rows, sheet_id)}})
+                requests.extend({'deleteSheet': {'sheetId': sheet_id}} for sheet_id in default_sheet_ids)
+            else:
+                # Create new spreadsheet together with all its sheets (so there is no default Sheet1 to remove)
+                spreadsheet = self.service.spreadsheets().create(
+                    body={
+                        'properties': {'title': sheet_title},
+                        'sheets': [{'properties': self._sheet_properties(title, headers, rows)} for title, headers, _, rows in sheets]
+                    }
+                ).execute()
+                self.spreadsheet_id = spreadsheet['spreadsheetId']
+                sheet_ids = [sheet['properties']['sheetId'] for sheet in spreadsheet['sheets']]
             
-            # Write each sequence to a separate sheet
-            first_sequence = True
-            for sequence_name, sequence_data in log_data.items():
-                self._write_sequence_data(sequence_name, sequence_data)
-                
-                if first_sequence:
-                    # Remove a default empty sheet after creating the first non-empty sheet
-                    try:
-                        spreadsheet_info = self.service.spreadsheets().get(
-                            spreadsheetId=self.spreadsheet_id
-                        ).execute()
-                        sheet1_id = spreadsheet_info['sheets'][0]['properties']['sheetId']
-                        
-                        delete_request = {
-                            'deleteSheet': {
-                                'sheetId': sheet1_id
-                            }
-                        }
-                        self.service.spreadsheets().batchUpdate(
-                            spreadsheetId=self.spreadsheet_id,
-                            body={'requests': [delete_request]}
-                        ).execute()
-                    except Exception as e:
-                        self.logger.log(f"Warning: Could not remove default Sheet1: {str(e)}", "WARNING")
-                    
-                    first_sequence = False
+            # Sheet structure and formatting of all sheets go in a single batchUpdate
+            for sheet_id, (title, headers, column_widths, rows) in zip(sheet_ids, sheets):
+                requests.extend(self._formatting_requests(sheet_id, len(rows) + 1, column_widths))
+            self._batch_update(requests)
             
-            # Add debug logs if enabled
-            if debug_logs and self.config['config'].get('debug_mode', False):
-                self._write_debug_logs(debug_logs)
+            # Values are written for each sheet separately, so a failed sheet doesn't take the others with it
+            for title, headers, _, rows in sheets:
+                self._write_values(title, [headers] + rows)
             
             self.spreadsheet_url = f"https://docs.google.com/spreadsheets/d/{self.spreadsheet_id}"
-            #self.logger.log(f"Data successfully saved to Google Sheets: {self.spreadsheet_url}", "INFO")
+            #self.logger.log(f"Data successfully saved to Google Sheets: {self.spreadsheet_url}", level="INFO")
             return self.spreadsheet_url
         
         except HttpError as e:
             if e.resp.status == 429 or 'quotaExceeded' in str(e):
                 error_msg = "Google Sheets API quota exceeded. Try again later or use Excel file as the output."
-                self.logger.log(error_msg, "ERROR")
+                self.logger.log(error_msg, level="ERROR")
                 raise Exception(error_msg)
             raise    
         
         except Exception as e:
-            self.logger.log(f"Error saving to Google Sheets: {str(e)}", "ERROR")
+            self.logger.log(f"Error saving to Google Sheets: {str(e)}", level="ERROR")
             raise
             
-    def _move_to_folder(self):
-        """Move the spreadsheet to a specified Google Drive folder"""
+    def _create_in_folder(self, title, folder_id):
+        """Create an empty spreadsheet directly in a Google Drive folder, returns its ID (None if it couldn't be created there)"""
         try:
-            folder_id = self.config['config']['google_sheets']['folder_id']
-            
-            # Get credentials
-            auth = GoogleSheetsAuth(self.config, self.logger)
-            auth.authenticate()
-            credentials = auth.credentials
-            
-            # Create Drive service with authenticated credentials
-            drive_service = build('drive', 'v3', credentials=credentials)
-            
-            # Get the file's current parents
-            file = drive_service.files().get(
-                fileId=self.spreadsheet_id,
-                fields='parents'
-            ).execute()
-            
-            # Move file to the new folder
-            previous_parents = ",".join(file.get('parents', []))
-            drive_service.files().update(
-                fileId=self.spreadsheet_id,
-                addParents=folder_id,
-                removeParents=previous_parents,
-                fields='id, parents'
+            file = self._get_drive_service().files().create(
+                body={
+                    'name': title,
+                    'mimeType': 'application/vnd.google-apps.spreadsheet',
+                    'parents': [folder_id]
+                },
+                fields='id'
             ).execute()
+            return file['id']
             
         except HttpError as e:
             if e.resp.status == 429 or 'quotaExceeded' in str(e):
                 error_msg = "Google Drive API quota exceeded. Try again later or use Excel file as the output."
-                self.logger.log(error_msg, "ERROR")
+                self.logger.log(error_msg, level="ERROR")
                 raise Exception(error_msg)
-            raise    
+            self.logger.log(f"Warning: Could not create file in the specified folder: {str(e)}", level="WARNING")
                     
         except Exception as e:
-            self.logger.log(f"Warning: Could not move file to the specified folder: {str(e)}", "WARNING")
+            self.logger.log(f"Warning: Could not create file in the specified folder: {str(e)}", level="WARNING")
+        return None
+    
+    def _get_sheet_ids(self):
+        """IDs of the sheets in the current spreadsheet"""
+        spreadsheet = self.service.spreadsheets().get(
+            spreadsheetId=self.spreadsheet_id,
+            fields='sheets.properties.sheetId'
+        ).execute()
+        return [sheet['properties']['sheetId'] for sheet in spreadsheet.get('sheets', [])]
     
-    def _write_sequence_data(self, sequence_name, data):
-        """Write sequence data to a sheet"""
+    def _get_drive_service(self):
+        """Build the Drive service once, sharing the HTTP client already authenticated for Sheets"""
+        if self._drive_service is None:
+            self._drive_service = build('drive', 'v3', http=self.http, cache_discovery=False)
+        return self._drive_service
+    
+    @staticmethod
+    def _sheet_properties(title, headers, rows, sheet_id=None):
+        """Properties of a new sheet, sized to its data, so the formatting requests cover all of its rows"""
+        properties = {
+            'title': title,
+            'gridProperties': {'rowCount': len(rows) + 1, 'columnCount': len(headers)}
+        }
+        if sheet_id is not None:
+            properties['sheetId'] = sheet_id
+        return properties
+    
+    def _write_values(self, title, values):
+        """
+        Write the values of a single sheet (RAW - strings are never parsed), in chunks of rows, so large sheets
+        (e.g. a long debug_log) stay below the request size limit
+        """
+        sheet_range = "'" + title.replace("'", "''") + "'"  # quoted, sequence names may contain spaces or quotes
         try:
-            # Prepare headers and values
-            headers = ["Step", "Event", "Timestamp", "URL", "Event Data", "Valid", "Error Details"]
-            values = [headers] + data
-            
-            # Create new sheet
-            sheet_id = self._create_sheet(sequence_name)
-            
-            # Update values
-            body = {'values': values}
-            self.service.spreadsheets().values().update(
-                spreadsheetId=self.spreadsheet_id,
-                range=f"{sequence_name}!A1",
-                valueInputOption='RAW',
-                body=body
-            ).execute()
-            
-            # Apply formatting
-            self._apply_formatting(sheet_id, len(values), len(headers))
-
+            for start in range(0, len(values), SHEETS_WRITE_CHUNK_ROWS):
+                self.service.spreadsheets().values().update(
+                    spreadsheetId=self.spreadsheet_id,
+                    range=f"{sheet_range}!A{start + 1}",
+                    valueInputOption='RAW',
+                    body={'values': values[start:start + SHEETS_WRITE_CHUNK_ROWS]}
+                ).execute()
+        
         except HttpError as e:
             if e.resp.status == 429 or 'quotaExceeded' in str(e):
                 error_msg = "Google Sheets API quota exceeded. Try again later or use Excel file as the output."
-                self.logger.log(error_msg, "ERROR")
+                self.logger.log(error_msg, level="ERROR")
                 raise Exception(error_msg)
-            raise    
-
+            self.logger.log(f"Error writing sheet {title}: {str(e)}", level="ERROR")
+        
         except Exception as e:
-            self.logger.log(f"Error writing sheet {sequence_name}: {str(e)}", "ERROR")
-            raise
+            self.logger.log(f"Error writing sheet {title}: {str(e)}", level="ERROR")
     
-    def _create_sheet(self, sheet_name):
-        """Create a new sheet and return its ID"""
-        try:
-            request = {
-                'addSheet': {
+    def _formatting_requests(self, sheet_id, row_count, column_widths):
+        """Build formatting requests for a single sheet"""
+        # Column widths are set explicitly (same as in Excel files) - autoResizeDimensions would measure every cell
+        width_requests = [
+            {
+                'updateDimensionProperties': {
+                    'range': {
+                        'sheetId': sheet_id,
+                        'dimension': 'COLUMNS',
+                        'startIndex': index,
+                        'endIndex': index + 1
+                    },
                     'properties': {
-                        'title': sheet_name[:31]  # Sheet names are limited to 31 chars
-                    }
+                        'pixelSize': width * EXCEL_WIDTH_PIXELS
+                    },
+                    'fields': 'pixelSize'
                 }
             }
-            response = self.service.spreadsheets().batchUpdate(
-                spreadsheetId=self.spreadsheet_id,
-                body={'requests': [request]}
-            ).execute()
-            return response['replies'][0]['addSheet']['properties']['sheetId']
-
-        except HttpError as e:
-            if e.resp.status == 429 or 'quotaExceeded' in str(e):
-                error_msg = "Google Sheets API quota exceeded. Try again later or use Excel file as the output."
-                self.logger.log(error_msg, "ERROR")
-                raise Exception(error_msg)
-            raise    
-
-        except Exception as e:
-            self.logger.log(f"Error creating sheet {sheet_name}: {str(e)}", "ERROR")
-            raise
-    
-    def _apply_formatting(self, sheet_id, row_count, col_count):
-        """Apply formatting to the sheet"""
-        try:
-            requests = [
-                # Format header row
-                {
-                    'repeatCell': {
-                        'range': {
-                            'sheetId': sheet_id,
-                            'startRowIndex': 0,
-                            'endRowIndex': 1
-                        },
-                        'cell': {
-                            'userEnteredFormat': {
-                                'backgroundColor': {'red': 0.9, 'green': 0.9, 'blue': 0.9},
-                                'textFormat': {'bold': True}
-                            }
-                        },
-                        'fields': 'userEnteredFormat(backgroundColor,textFormat)'
-                    }
-                },
-                # Adjust column widths
-                {
-                    'autoResizeDimensions': {
-                        'dimensions': {
-                            'sheetId': sheet_id,
-                            'dimension': 'COLUMNS',
-                            'startIndex': 0,
-                            'endIndex': col_count
+            for index, (_, width) in enumerate(column_widths)
+        ]
+        return width_requests + [
+            # Format header row
+            {
+                'repeatCell': {
+                    'range': {
+                        'sheetId': sheet_id,
+                        'startRowIndex': 0,
+                        'endRowIndex': 1
+                    },
+                    'cell': {
+                        'userEnteredFormat': {
+                            'backgroundColor': {'red': 0.9, 'green': 0.9, 'blue': 0.9},
+                            'textFormat': {'bold': True}
                         }
-                    }
-                },
-                # Set column width for URLs
-                 {
-                    'updateDimensionProperties': {
-                        'range': {
-                            'sheetId': sheet_id,
-                            'dimension': 'COLUMNS',
-                            'startIndex': 3,
-                            'endIndex': 4 
-                        },
-                        'properties': {
-                            'pixelSize': 200
-                        },
-                        'fields': 'pixelSize'
-                    }
-                },
-                # Set row height
-                {
-                    'updateDimensionProperties': {
-                        'range': {
-                            'sheetId': sheet_id,
-                            'dimension': 'ROWS',
-                            'startIndex': 0,
-                            'endIndex': row_count
-                        },
-                        'properties': {
-                            'pixelSize': 30  # height
-                        },
-                        'fields': 'pixelSize'
-                    }
+                    },
+                    'fields': 'userEnteredFormat(backgroundColor,textFormat)'
                 }
-            ]
-            
-            self.service.spreadsheets().batchUpdate(
-                spreadsheetId=self.spreadsheet_id,
-                body={'requests': requests}
-            ).execute()
-            
-        except Exception as e:
-            self.logger.log(f"Warning: Could not apply formatting: {str(e)}", "WARNING")
+            },
+            # Set row height
+            {
+                'updateDimensionProperties': {
+                    'range': {
+                        'sheetId': sheet_id,
+                        'dimension': 'ROWS',
+                        'startIndex': 0,
+                        'endIndex': row_count
+                    },
+                    'properties': {
+                        'pixelSize': 30  # height
+                    },
+                    'fields': 'pixelSize'
+                }
+            }
+        ]
     
-    def _write_debug_logs(self, debug_logs):
-        """Write debug logs to a separate sheet"""
+    def _batch_update(self, requests):
+        """Send the structure and formatting requests of all sheets in a single batchUpdate"""
         try:
-            # Create debug log sheet
-            sheet_name = "debug_log"
-            sheet_id = self._create_sheet(sheet_name)
-            
-            # Prepare headers and values
-            headers = ["Timestamp", "Level", "Message"]
-            values = [headers] + debug_logs
-            
-            # Update values
-            body = {'values': values}
-            self.service.spreadsheets().values().update(
+            self.service.spreadsheets().batchUpdate(
                 spreadsheetId=self.spreadsheet_id,
-                range=f"{sheet_name}!A1",
-                valueInputOption='RAW',
-                body=body
+                body={'requests': requests}
             ).execute()
             
-            # Apply formatting
-            self._apply_formatting(sheet_id, len(values), len(headers))
-
         except HttpError as e:
             if e.resp.status == 429 or 'quotaExceeded' in str(e):
                 error_msg = "Google Sheets API quota exceeded. Try again later or use Excel file as the output."
-                self.logger.log(error_msg, "ERROR")
+                self.logger.log(error_msg, level="ERROR")
                 raise Exception(error_msg)
-            raise
+            raise    
 
         except Exception as e:
-            self.logger.log(f"Warning: Could not write debug logs: {str(e)}", "WARNING")
+            self.logger.log(f"Error writing sheets: {str(e)}", level="ERROR")
+            raise
 
 ##### FUNCTIONS
 
+# End of the readable part of an error message: the first line break or the start of the stacktrace
+ERROR_MESSAGE_END = re.compile(r'\n|Stacktrace')
+
 def clean_error_message(error):
     """Clean error message by removing stacktrace and technical details"""
     error_str = str(error)
-    # Get first line of error message or everything before stacktrace
-    cleaned = error_str.split('\n')[0].split('Stacktrace')[0].strip()
+    # Get first line of error message or everything before stacktrace - one scan, no intermediate lists
+    cleaned = ERROR_MESSAGE_END.split(error_str, 1)[0].strip()
     if not cleaned:  # If empty after cleaning, use a generic message
         cleaned = f"Browser error occurred: {error.__class__.__name__}"
     return cleaned
 
+def dump_json_pretty(data):
+    """Serialize data to indented JSON - with orjson if it's installed, standard json otherwise"""
+    if orjson is not None:
+        try:
+            return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS).decode()
+        except TypeError:  # e.g. integers larger than 64 bits - let the standard library handle them
+            pass
+    return json.dumps(data, indent=2, ensure_ascii=False)
+
+def load_json(text):
+    """Parse JSON text - with orjson if it's installed, standard json otherwise"""
+    if orjson is not None:
+        try:
+            return orjson.loads(text)
+        except orjson.JSONDecodeError:  # let the standard library parse (or report) what orjson rejects
+            pass
+    return json.loads(text)
+
+# A comment ("#" to the end of line) on the last line of validation code, and a line break with the whitespace
+# around it and the comment before it
+VALIDATION_LINE_BREAK = re.compile(r'[^\S\n]*(?:#[^\n]*)?\n[^\S\n]*')
+VALIDATION_TRAILING_COMMENT = re.compile(r'[^\S\n]*#[^\n]*\Z')
+
 def parse_validation_from_toml(config, logger):
     """
     Parse validation rules from TOML config.
@@ -594,9 +895,8 @@ def parse_validation_from_toml(config, logger):
         code_str = code_str.strip()
         if not (code_str.startswith('{') and code_str.endswith('}')):
             code_str = "{" + code_str + "}"
-        # Remove comments and clean up
-        code_lines = [line.split('#')[0].strip() for line in code_str.split('\n')]
-        code_str = ' '.join(code_lines)
+        # Remove comments and join lines (each line stripped, separated by a single space)
+        code_str = VALIDATION_LINE_BREAK.sub(' ', VALIDATION_TRAILING_COMMENT.sub('', code_str))
         
         try:
             rule_dict = parse_validation_code_block(code_str, logger)
@@ -606,6 +906,21 @@ def parse_validation_from_toml(config, logger):
     
     return validation_rules
 
+# Tokens of validation code blocks, tried in this order at every position - the unclosed_* groups only match
+# when the complete token couldn't, and words stop at the characters that start other tokens
+VALIDATION_TOKEN = re.compile(r"""
+    (?P<space>\s+)
+  | (?P<punct>[{}\[\]:,])
+  | (?P<regex>/[^/]*/)
+  | (?P<type><[^>]*>)
+  | (?P<string>"(?:[^"\\]|\\.)*"|'(?:[^'\\]|\\.)*')
+  | (?P<unclosed_regex>/)
+  | (?P<unclosed_type><)
+  | (?P<unclosed_string>["'])
+  | (?P<word>[^{}\[\]:,"'/ \t\n\r]+)
+""", re.VERBOSE | re.DOTALL)
+STRING_ESCAPE = re.compile(r'\\(.)', re.DOTALL)
+
 def parse_validation_code_block(code_str, logger):
     """
     A parser for validation blocks from TOML files.
@@ -617,93 +932,43 @@ def parse_validation_code_block(code_str, logger):
         or unquoted keys. Returns a list of tokens.
         """
         tokens = []
-        i = 0
-        while i < len(s):
-            c = s[i]
-
-            # Skip whitespace
-            if c.isspace():
-                i += 1
-                continue
-
-            # Single character tokens
-            if c in '{}[]:,':
-                tokens.append(c)
-                i += 1
+        append = tokens.append
+        for match in VALIDATION_TOKEN.finditer(s):
+            kind = match.lastgroup
+            token = match.group()
+            
+            if kind == 'space':
                 continue
-
-            # Regex patterns
-            if s.startswith('/', i):
-                j = s.find('/', i+1)
-                if j == -1:
-                    raise ValueError("Unclosed '/' in regex pattern")
-                regex_token = s[i:j+1]
+            
+            if kind == 'regex':
                 try:
-                    re.compile(regex_token[1:-1])  # Validate it's a valid regex
-                    tokens.append(regex_token)
-                    i = j+1
-                    continue
+                    get_compiled_pattern(token[1:-1])  # Validate it's a valid regex - cached, so compiling the rules later reuses it
                 except re.error:
-                    raise ValueError(f"Invalid regex pattern: {regex_token}")
-
-            # Type specifiers
-            if s.startswith('<', i):
-                j = s.find('>', i+1)
-                if j == -1:
-                    raise ValueError("Unclosed '< >' for type")
-                type_token = s[i:j+1]
+                    raise ValueError(f"Invalid regex pattern: {token}")
+            
+            elif kind == 'type':
                 # Validate allowed type specifiers
-                if type_token.lower() not in allowed_validation_types:
-                    raise ValueError(f"Invalid type specifier '{type_token}'. Must be one of: {', '.join(allowed_validation_types)}")
-                tokens.append(type_token)
-                i = j+1
-                continue
-
-            # Quoted strings
-            if s.startswith('"', i) or s.startswith("'", i):
-                quote_char = s[i]
-                j = i + 1
-                buff = []
-                escaped = False
-                
-                while j < len(s):
-                    curr_char = s[j]
-                    
-                    if escaped:
-                        # Handle escaped character
-                        if curr_char == quote_char or curr_char == '\\':
-                            buff.append(curr_char)
-                        else:
-                            buff.append('\\' + curr_char)
-                        escaped = False
-                        j += 1
-                        continue
-                        
-                    if curr_char == '\\':
-                        escaped = True
-                        j += 1
-                        continue
-                        
-                    if curr_char == quote_char:
-                        break
-                        
-                    buff.append(curr_char)
-                    j += 1
-                    
-                if j >= len(s) or s[j] != quote_char:
-                    raise ValueError(f"Unterminated string starting at position {i}")
-                    
-                tokens.append(''.join(buff))
-                i = j + 1
-                continue
-
-            # Unquoted keys/values 
-            special = set('{}[]:,"\'/ \t\n\r')
-            buff = []
-            while i < len(s) and s[i] not in special:
-                buff.append(s[i])
-                i += 1
-            tokens.append(''.join(buff))
+                if token.lower() not in allowed_validation_types:
+                    raise ValueError(f"Invalid type specifier '{token}'. Must be one of: {', '.join(allowed_validation_types)}")
+            
+            elif kind == 'string':
+                quote_char = token[0]
+                token = token[1:-1]
+                if '\\' in token:
+                    # Escaped quotes and backslashes lose the backslash, other escapes are kept as they are
+                    token = STRING_ESCAPE.sub(
+                        lambda match: match.group(1) if match.group(1) in (quote_char, '\\') else match.group(),
+                        token
+                    )
+            
+            elif kind == 'unclosed_regex':
+                raise ValueError("Unclosed '/' in regex pattern")
+            elif kind == 'unclosed_type':
+                raise ValueError("Unclosed '< >' for type")
+            elif kind == 'unclosed_string':
+                raise ValueError(f"Unterminated string starting at position {match.start()}")
+            
+            append(token)
 
         return tokens
 
@@ -757,7 +1022,7 @@ def parse_validation_code_block(code_str, logger):
             # key
             key = parse_value() 
             if not isinstance(key, str):
-                logger.log(f"⚠️  Validation key should be a string: {str(key)}.\nPlease review your configuration file.", "ERROR")
+                logger.log(f"⚠️  Validation key should be a string: {str(key)}.\nPlease review your configuration file.", level="ERROR")
             # Handle required field marker (!)
             required = False
             if key.startswith('!'):
@@ -811,16 +1076,109 @@ def parse_validation_code_block(code_str, logger):
     result = parse_object(logger) if tokens[0] == '{' else parse_object(logger)
     return result
 
+def is_number(value):
+    """True for numbers from the config - ints and floats, but not booleans (exact type checks, no isinstance tuple walk)"""
+    value_type = type(value)
+    return value_type is int or value_type is float
+
+def is_whole_number(value):
+    """True for whole numbers from the config - ints, but not booleans"""
+    return type(value) is int
+
+def validate_visit_step(step_name, step):
+    """Validate a 'visit' step - the URL is optional, but must be a string or list of strings"""
+    if 'url' in step:
+        url = step['url']
+        if isinstance(url, list):
+            if not all(isinstance(u, str) for u in url):
+                raise ValueError(f"All URLs in step '{step_name}' must be strings")
+        elif not isinstance(url, str):
+            raise ValueError(f"URL in step '{step_name}' must be a string or list of strings")
+
+def validate_click_step(step_name, step):
+    """Validate a 'click' step and each of its clicks"""
+    if 'clicks' not in step:
+        raise ValueError(f"Click step '{step_name}' missing required 'clicks' list")
+    clicks = step['clicks']
+    if not isinstance(clicks, list):
+        raise ValueError(f"Clicks in step '{step_name}' must be a list")
+    for i, click in enumerate(clicks):
+        if not isinstance(click, dict):
+            raise ValueError(f"Click {i} in step '{step_name}' must be a dictionary (in curly brackets), e.g. " + "{ selector = 'a.button_purchase' }")
+        if not ('xpath' in click or 'selector' in click):
+            raise ValueError(f"Click {i} in step '{step_name}' missing either 'xpath' or 'selector'")
+        # Validate delay_after if present
+        if 'delay_after' in click and not is_number(click['delay_after']):
+            raise ValueError(f"delay_after in click {i} of step '{step_name}' must be a number - without quotation marks, e.g. delay_after = 2")
+
+FORM_FILL_METHODS = ('selenium', 'js')
+FORM_SUBMIT_METHODS = ('selenium', 'js', 'action')
+
+def validate_form_step(step_name, step):
+    """Validate a 'form' step and each of its fields"""
+    if 'fields' not in step:
+        raise ValueError(f"Form step '{step_name}' missing required 'fields' list")
+    fields = step['fields']
+    if not isinstance(fields, list):
+        raise ValueError(f"Fields in step '{step_name}' must be a list, in square brackets []")
+    if 'submit_button' not in step:
+        raise ValueError(f"Form step '{step_name}' missing required 'submit_button'. See the documentation for more details'")
+    for i, field in enumerate(fields):
+        if not isinstance(field, dict):
+            raise ValueError(f"Field {i} in form step '{step_name}' must be a dictionary (in curly brackets), e.g. " + "{ selector = '#FirstNameInput', value = 'John' }")
+        if not ('xpath' in field or 'selector' in field):
+            raise ValueError(f"Field {i} in form step '{step_name}' missing either 'xpath' or 'selector'")
+    if step.get('fill_method', 'selenium') not in FORM_FILL_METHODS:
+        raise ValueError(f"fill_method in form step '{step_name}' must be one of: {', '.join(FORM_FILL_METHODS)}")
+    if step.get('submit_method', 'selenium') not in FORM_SUBMIT_METHODS:
+        raise ValueError(f"submit_method in form step '{step_name}' must be one of: {', '.join(FORM_SUBMIT_METHODS)}")
+
+SCROLL_TARGET_PARAMS = frozenset(('xpath', 'selector', 'pixels', 'percentage'))
+
+def validate_scroll_step(step_name, step):
+    """Validate a 'scroll' step - exactly one of: xpath, selector, pixels, or percentage"""
+    present_params = SCROLL_TARGET_PARAMS & step.keys()
+
+    if not present_params:
+        raise ValueError(f"Scroll step '{step_name}' must specify one of: xpath, selector, pixels, or percentage")
+
+    if len(present_params) > 1:
+        raise ValueError(f"Scroll step '{step_name}' can only specify one of: xpath, selector, pixels, or percentage")
+
+    # If using pixels or percentage, validate they're numbers
+    if 'pixels' in step:
+        pixels = step['pixels']
+        if not is_number(pixels):
+            raise ValueError(f"Pixels in scroll step '{step_name}' must be a number, without quotation marks, e.g. pixels = 100")
+        if pixels <= 0:
+            raise ValueError(f"Pixels in scroll step '{step_name}' must be positive (more than 0)")
+
+    if 'percentage' in step:
+        percentage = step['percentage']
+        if not is_number(percentage):
+            raise ValueError(f"Percentage in scroll step '{step_name}' must be a number between 0 and 100, without quotation marks and wothout % sign, e.g. percentage = 75")
+        if not 0 <= percentage <= 100:
+            raise ValueError(f"Percentage in scroll step '{step_name}' must be between 0 and 100")
+
+# Step type -> validator taking (step_name, step) and raising ValueError
+STEP_VALIDATORS = {
+    'visit': validate_visit_step,
+    'click': validate_click_step,
+    'form': validate_form_step,
+    'scroll': validate_scroll_step,
+}
+
+REQUIRED_SECTIONS = frozenset(('config', 'step', 'sequence'))
+
 def validate_sequence(config, logger):
     """
     Validate the entire sequence configuration with detailed checks.
     Raises ValueError with specific messages if validation fails.
     """
     # Check for required top-level sections
-    required_sections = ['config', 'step', 'sequence']
-    missing_sections = [section for section in required_sections if section not in config]
+    missing_sections = REQUIRED_SECTIONS.difference(config)
     if missing_sections:
-        raise ValueError(f"Missing required configuration sections: {', '.join(missing_sections)}")
+        raise ValueError(f"Missing required configuration sections: {', '.join(sorted(missing_sections))}")
     
     # Validate user agents
     if not config['config'].get('user_agents'):
@@ -840,7 +1198,7 @@ def validate_sequence(config, logger):
     # Validate output configuration
     output_destination = config['config'].get('output_destination', 'excel')
     if output_destination not in ['excel', 'google_sheets']:
-        logger.log(f"Warning: Invalid output_destination '{output_destination}' - must be 'excel' or 'google_sheets'. Using 'excel' as default.", "WARNING")
+        logger.log(f"Warning: Invalid output_destination '{output_destination}' - must be 'excel' or 'google_sheets'. Using 'excel' as default.", level="WARNING")
         config['config']['output_destination'] = 'excel'
         
     # Validate Google Sheets configuration when it's selected as output
@@ -853,7 +1211,7 @@ def validate_sequence(config, logger):
         # Validate credentials configuration
         credentials_location = gs_config.get('credentials_location', 'file')
         if credentials_location not in ['file', 'env']:
-            logger.log(f"Warning: Invalid credentials_location '{credentials_location}' - must be 'file' or 'env'. Using 'file' as default.", "WARNING")
+            logger.log(f"Warning: Invalid credentials_location '{credentials_location}' - must be 'file' or 'env'. Using 'file' as default.", level="WARNING")
             gs_config['credentials_location'] = 'file'
             
         if credentials_location == 'file' and not gs_config.get('credentials_path'):
@@ -865,7 +1223,7 @@ def validate_sequence(config, logger):
         # Validate token configuration
         token_location = gs_config.get('token_location', 'file')
         if token_location not in ['file', 'env']:
-            logger.log(f"Warning: Invalid token_location '{token_location}' - must be 'file' or 'env'. Using 'file' as default.", "WARNING")
+            logger.log(f"Warning: Invalid token_location '{token_location}' - must be 'file' or 'env'. Using 'file' as default.", level="WARNING")
             gs_config['token_location'] = 'file'
             
         # Folder ID is optional but must be string if present
@@ -878,8 +1236,8 @@ def validate_sequence(config, logger):
         if not isinstance(output_folder, str):
             raise ValueError("output_folder must be a string in quotation marks, e.g. 'results' or '/path/to/folder'")
 
-    # Get set of defined steps
-    steps_defined = set(config['step'].keys())
+    # Get set of defined steps (a keys view - set operations work on it directly)
+    steps_defined = config['step'].keys()
     if not steps_defined:
         raise ValueError("No steps defined in configuration")
     
@@ -887,78 +1245,28 @@ def validate_sequence(config, logger):
     for step_name, step in config['step'].items():
         if 'type' not in step:
             raise ValueError(f"Step '{step_name}' missing required 'type' field")
-            
+
         # Validate step type-specific requirements
-        if step['type'] == 'visit':
-            # URL is optional for visit steps
-            if 'url' in step:
-                # If URL is present, validate its format
-                if isinstance(step['url'], list):
-                    if not all(isinstance(u, str) for u in step['url']):
-                        raise ValueError(f"All URLs in step '{step_name}' must be strings")
-                elif not isinstance(step['url'], str):
-                    raise ValueError(f"URL in step '{step_name}' must be a string or list of strings")
-                    
-        elif step['type'] == 'click':
-            if 'clicks' not in step:
-                raise ValueError(f"Click step '{step_name}' missing required 'clicks' list")
-            if not isinstance(step['clicks'], list):
-                raise ValueError(f"Clicks in step '{step_name}' must be a list")
-            for i, click in enumerate(step['clicks']):
-                if not isinstance(click, dict):
-                    raise ValueError(f"Click {i} in step '{step_name}' must be a dictionary (in curly brackets), e.g. " + "{ selector = 'a.button_purchase' }")
-                if not ('xpath' in click or 'selector' in click):
-                    raise ValueError(f"Click {i} in step '{step_name}' missing either 'xpath' or 'selector'")
-                # Validate delay_after if present
-                if 'delay_after' in click and not isinstance(click['delay_after'], (int, float)):
-                    raise ValueError(f"delay_after in click {i} of step '{step_name}' must be a number - without quotation marks, e.g. delay_after = 2")
-                    
-        elif step['type'] == 'form':
-            if 'fields' not in step:
-                raise ValueError(f"Form step '{step_name}' missing required 'fields' list")
-            if not isinstance(step['fields'], list):
-                raise ValueError(f"Fields in step '{step_name}' must be a list, in square brackets []")
-            if 'submit_button' not in step:
-                raise ValueError(f"Form step '{step_name}' missing required 'submit_button'. See the documentation for more details'")
-            for i, field in enumerate(step['fields']):
-                if not isinstance(field, dict):
-                    raise ValueError(f"Field {i} in form step '{step_name}' must be a dictionary (in curly brackets), e.g. " + "{ selector = '#FirstNameInput', value = 'John' }")
-                if not ('xpath' in field or 'selector' in field):
-                    raise ValueError(f"Field {i} in form step '{step_name}' missing either 'xpath' or 'selector'")  
-        
-        elif step['type'] == 'scroll':
-            # Must have exactly one of: xpath, selector, pixels, or percentage
-            scroll_params = ['xpath', 'selector', 'pixels', 'percentage']
-            present_params = [param for param in scroll_params if param in step]
-            
-            if not present_params:
-                raise ValueError(f"Scroll step '{step_name}' must specify one of: xpath, selector, pixels, or percentage")
-                
-            if len(present_params) > 1:
-                raise ValueError(f"Scroll step '{step_name}' can only specify one of: xpath, selector, pixels, or percentage")
-                
-            # If using pixels or percentage, validate they're numbers
-            if 'pixels' in step:
-                if not isinstance(step['pixels'], (int, float)):
-                    raise ValueError(f"Pixels in scroll step '{step_name}' must be a number, without quotation marks, e.g. pixels = 100")
-                if step['pixels'] <= 0:
-                    raise ValueError(f"Pixels in scroll step '{step_name}' must be positive (more than 0)")
-                    
-            if 'percentage' in step:
-                if not isinstance(step['percentage'], (int, float)):
-                    raise ValueError(f"Percentage in scroll step '{step_name}' must be a number between 0 and 100, without quotation marks and wothout % sign, e.g. percentage = 75")
-                if not 0 <= step['percentage'] <= 100:
-                    raise ValueError(f"Percentage in scroll step '{step_name}' must be between 0 and 100")
-        
-        else:
+        validator = STEP_VALIDATORS.get(step['type'])
+        if validator is None:
             raise ValueError(f"Unknown step type '{step['type']}' in step '{step_name}'")
-            
+        validator(step_name, step)
+
         # Validate step parameters
         if 'delay_after' in step:
-            if not isinstance(step['delay_after'], (int, float)):
+            delay_after = step['delay_after']
+            if not is_number(delay_after):
                 raise ValueError(f"delay_after in step '{step_name}' must be a number, without quotation marks, e.g. delay_after = 2")
-            if step['delay_after'] < 0:
+            if delay_after < 0:
                 raise ValueError(f"delay_after in step '{step_name}' cannot be negative")
+        
+        if 'wait_for_event' in step:
+            wait_for_event = step['wait_for_event']
+            if not isinstance(wait_for_event, str) or not wait_for_event:
+                raise ValueError(f"wait_for_event in step '{step_name}' must be an event name in quotation marks, e.g. wait_for_event = 'purchase'")
+            track_events = config['config'].get('track_events')
+            if track_events and wait_for_event not in track_events:
+                raise ValueError(f"wait_for_event in step '{step_name}' must be one of track_events, otherwise it's never received")
     
     # Validate sequences
     if not config['sequence']:
@@ -975,48 +1283,245 @@ def validate_sequence(config, logger):
             raise ValueError(f"Sequence '{sequence_name}' contains no steps")
             
         # Check for undefined steps in sequence
-        unknown_steps = [step for step in sequence['steps'] if step not in steps_defined]
+        unknown_steps = set(sequence['steps']).difference(steps_defined)
         if unknown_steps:
+            # Listed in the sequence order, each one once
+            unknown_steps = [str(step) for step in dict.fromkeys(sequence['steps']) if step in unknown_steps]
             raise ValueError(f"Sequence '{sequence_name}' contains undefined steps: {', '.join(unknown_steps)}")
     
     # Validate delays and timeouts
     if 'default_timeout' in config['config']:
-        if not isinstance(config['config']['default_timeout'], (int, float)):
+        if not is_number(config['config']['default_timeout']):
             raise ValueError("default_timeout must be a number, e.g. default_timeout = 10")
         if config['config']['default_timeout'] <= 0:
             raise ValueError("default_timeout must be positive (higher than zero)")
             
+    if 'debug_log_csv_threshold' in config['config']:
+        threshold = config['config']['debug_log_csv_threshold']
+        if not is_whole_number(threshold) or threshold < 0:
+            raise ValueError("debug_log_csv_threshold must be a whole number, e.g. debug_log_csv_threshold = 10000")
+            
+    if 'max_log_entries' in config['config']:
+        max_log_entries = config['config']['max_log_entries']
+        if not is_whole_number(max_log_entries) or max_log_entries < 0:
+            raise ValueError("max_log_entries must be a whole number of 0 (no limit) or more, e.g. max_log_entries = 100000")
+            
+    if 'parallel_sequences' in config['config']:
+        parallel_sequences = config['config']['parallel_sequences']
+        if not is_whole_number(parallel_sequences) or parallel_sequences < 1:
+            raise ValueError("parallel_sequences must be a whole number of 1 or more, e.g. parallel_sequences = 2")
+    
+    if 'processed_events_limit' in config['config']:
+        processed_events_limit = config['config']['processed_events_limit']
+        if not is_whole_number(processed_events_limit) or processed_events_limit < 1:
+            raise ValueError("processed_events_limit must be a whole number of 1 or more, e.g. processed_events_limit = 4096")
+    
+    if 'event_queue_max' in config['config']:
+        event_queue_max = config['config']['event_queue_max']
+        if not is_whole_number(event_queue_max) or event_queue_max < 1:
+            raise ValueError("event_queue_max must be a whole number of 1 or more, e.g. event_queue_max = 10000")
+            
     if 'default_delay' in config['config']:
-        if not isinstance(config['config']['default_delay'], (int, float)):
+        if not is_number(config['config']['default_delay']):
             raise ValueError("default_delay must be a number, e.g. default_delay = 2")
         if config['config']['default_delay'] < 0:
             raise ValueError("default_delay cannot be negative, zero or higher")
     
+    if 'random_seed' in config['config']:
+        random_seed = config['config']['random_seed']
+        if not is_whole_number(random_seed):
+            raise ValueError("random_seed must be a whole number, e.g. random_seed = 42")
+    
+    if 'scroll_settle_timeout' in config['config']:
+        if not is_number(config['config']['scroll_settle_timeout']):
+            raise ValueError("scroll_settle_timeout must be a number, e.g. scroll_settle_timeout = 1")
+        if config['config']['scroll_settle_timeout'] < 0:
+            raise ValueError("scroll_settle_timeout cannot be negative, zero or higher")
+    
     # All validations passed
     return True
 
+def build_settings(cfg):
+    """Resolve the settings read during steps (with their defaults) once, into a simple attribute namespace"""
+    return SimpleNamespace(
+        default_timeout=cfg.get('default_timeout', 10),
+        default_delay=cfg.get('default_delay', 1),  # default delay is 1 second
+        scroll_settle_timeout=cfg.get('scroll_settle_timeout', 1),
+        bot_info=cfg.get('bot_info', False),
+        include_selenium_info=cfg.get('include_selenium_info', False),
+        headless=cfg.get('headless', False),
+        user_agents=tuple(cfg['user_agents']),
+        track_events=cfg['track_events'],
+        debug_mode=cfg.get('debug_mode', False),
+        hide_css="\n".join(f"{selector} {{ display: none !important; }}" for selector in cfg.get('css_elements_to_hide') or []),
+    )
+
+def get_config_cache_path(config_path):
+    """Cache file for a parsed config - in the user's cache directory, named after the config's absolute path"""
+    cache_dir = Path(os.environ.get('XDG_CACHE_HOME') or Path.home() / '.cache') / 'omdl'
+    path_hash = hashlib.sha1(str(Path(config_path).resolve()).encode('utf-8')).hexdigest()
+    return cache_dir / f"{path_hash}.pkl"
+
+def get_config_cache_key(config_path):
+    """
+    Cache key - the config file changes whenever its modification time or size does, and so may the parsing when
+    this script is updated
+    """
+    stat = os.stat(config_path)
+    return (str(Path(config_path).resolve()), stat.st_mtime_ns, stat.st_size, PROJECT_VERSION, os.stat(__file__).st_mtime_ns)
+
+# In-memory tier of the config cache, for configs loaded more than once in a process: cache key -> pickled config
+# (unpickling gives every caller its own copy to modify)
+_CONFIG_CACHE = {}
+
+def load_cached_config(config_path, logger):
+    """Return the parsed config from the cache, or None if there is no valid cache"""
+    try:
+        key = get_config_cache_key(config_path)
+        data = _CONFIG_CACHE.get(key)
+        if data is None:
+            with open(get_config_cache_path(config_path), 'rb') as file:
+                cache_key, data = pickle.load(file)
+            if cache_key != key:
+                return None
+            _CONFIG_CACHE[key] = data
+        logger.log("Using cached configuration (config file not changed)")
+        return pickle.loads(data)
+    except (OSError, EOFError, ValueError, TypeError, pickle.UnpicklingError):  # missing, unreadable or outdated cache
+        return None
+
+def to_plain_data(value):
+    """Copy parsed TOML data into plain dicts and lists (the toml parser uses its own dict classes for inline tables)"""
+    if isinstance(value, dict):
+        return {k: to_plain_data(v) for k, v in value.items()}
+    elif isinstance(value, list):
+        return [to_plain_data(item) for item in value]
+    return value
+
+def save_config_cache(config_path, config, logger):
+    """Store the parsed and validated config, so the next load of an unchanged file can skip parsing"""
+    cache_path = get_config_cache_path(config_path)
+    temp_path = cache_path.with_name(cache_path.name + ".tmp")
+    try:
+        key = get_config_cache_key(config_path)
+        data = pickle.dumps(to_plain_data(config), protocol=pickle.HIGHEST_PROTOCOL)
+        _CONFIG_CACHE[key] = data
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(temp_path, 'wb') as file:
+            pickle.dump((key, data), file, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(temp_path, cache_path)
+    except Exception as e:
+        logger.log(f"Could not save configuration cache: {clean_error_message(e)}")
+        try:
+            os.remove(temp_path)
+        except OSError:
+            pass
+
+URL_SCHEME_AND_SLASH = re.compile(r'^https?://|/+$')  # stripped from block_domains entries
+
+def build_block_rules(cfg, logger):
+    """Build the URL patterns of blocked requests from the config, for every browser of the run"""
+    block_rules = []
+    
+    # Built-in blockers for common services
+    if cfg.get('block_ga4', False):
+        block_rules.extend([
+            "*google-analytics.com/*",
+            "*analytics.google.com/*",
+            "*googletagmanager.com/gtag/*"
+        ])
+        
+    if cfg.get('block_gtm', False):
+        block_rules.append("*googletagmanager.com/*")
+        
+    if cfg.get('block_piwik', False):
+        block_rules.append("*piwik.pro/*")
+        
+    # Add custom domain blocking
+    if 'block_domains' in cfg:
+        custom_domains = cfg['block_domains']
+        if isinstance(custom_domains, list):
+            for domain in custom_domains:
+                if isinstance(domain, str):
+                    # Add both with and without www prefix
+                    clean_domain = URL_SCHEME_AND_SLASH.sub('', domain)
+                    block_rules.extend([
+                        f"*://{clean_domain}/*",
+                        f"*://*.{clean_domain}/*"
+                    ])
+                    logger.log(f"Added custom domain blocking for: {clean_domain}")
+                else:
+                    logger.log(f"Warning: Invalid domain format in block_domains: {domain}", level="ERROR")
+        else:
+            logger.log("Warning: block_domains must be a list", level="ERROR")
+    
+    # Overlapping settings (e.g. block_gtm with block_ga4, or repeated domains) produce duplicate patterns
+    return tuple(dict.fromkeys(block_rules))
+
+def prepare_config(config, logger):
+    """Build runtime structures derived from a validated config (they are never cached)"""
+    # Compile the rules once, so the monitoring thread doesn't re-interpret them for every event
+    config['_compiled_validation'] = {
+        event_name: compile_validation_rules(rules)
+        for event_name, rules in config['validation'].items()
+    }
+    config['_settings'] = build_settings(config['config'])
+    config['_block_rules'] = build_block_rules(config['config'], logger)
+    
+    for step in config['step'].values():
+        step_type = step['type']
+        # The final URLs to pick from (with "?bot=true" when bot_info is on) are built once, as a tuple
+        if step_type == 'visit':
+            if 'url' in step:
+                urls = step['url'] if isinstance(step['url'], list) else [step['url']]
+                step['_urls'] = tuple(url + "?bot=true" if config['_settings'].bot_info else url for url in urls)
+            continue
+        
+        # Resolve element locators once - retries and repeated steps reuse them
+        if step_type == 'click':
+            targets = step['clicks']
+        elif step_type == 'form':
+            step['_submit'] = {'xpath': step['submit_button']}
+            targets = [*step['fields'], step['_submit']]
+        elif 'xpath' in step or 'selector' in step:  # scroll to element
+            targets = (step,)
+        else:
+            continue
+        for params in targets:
+            params['_locator'] = get_element_locator(params, config)
+
 def load_config(config_path, logger):
     """Load configuration from a TOML file"""
     try:
         logger.log(f"Loading configuration from {config_path}")
-        with open(config_path, 'r') as file:
-            config = toml.load(file)
+        config = load_cached_config(config_path, logger)
         
-        config['validation'] = parse_validation_from_toml(config, logger)
-             
-        # track_events configuration (all if not specified)
-        if 'config' in config:
-            track_events = config['config'].get('track_events')
-            if track_events is None or (isinstance(track_events, list) and not track_events):
-                logger.log("No track_events specified - will track all events", "INFO")
-                config['config']['track_events'] = None
-
+        if config is None:
+            with open(config_path, 'r') as file:
+                config = toml.load(file)
+            
+            config['validation'] = parse_validation_from_toml(config, logger)
+                 
+            # track_events configuration (all if not specified)
+            if 'config' in config:
+                track_events = config['config'].get('track_events')
+                if track_events is None or (isinstance(track_events, list) and not track_events):
+                    logger.log("No track_events specified - will track all events", level="INFO")
+                    config['config']['track_events'] = None
+
+            if config.get('config', {}).get('config_cache', False):
+                save_config_cache(config_path, config, logger)
+        
+        # Validated on every run, also with a cached config - some checks depend on more than the file itself
+        # (e.g. environment variables with Google Sheets credentials)
         validate_sequence(config, logger)
+        
+        prepare_config(config, logger)
         logger.log("Configuration validation passed")
         return config
     
     except Exception as e:
-        logger.log(f"Error loading configuration: {clean_error_message(e)}", "ERROR")
+        logger.log(f"Error loading configuration: {clean_error_message(e)}", level="ERROR")
         sys.exit(1)
 
 def initialize_browser(config, logger):
@@ -1024,51 +1529,23 @@ def initialize_browser(config, logger):
     try:
         logger.log("Initializing browser with user agent settings")
         browser_options = webdriver.ChromeOptions()
-        user_agent = random.choice(config['config']['user_agents'])
+        user_agent = random_choice(config['_settings'].user_agents)
         
-        if config['config'].get('include_selenium_info', False):
+        if config['_settings'].include_selenium_info:
             user_agent += " Selenium"
             
         browser_options.add_argument(f'user-agent={user_agent}')
         browser_options.add_argument("--log-level=3") # Disable logging for webdriver
         browser_options.add_experimental_option('excludeSwitches', ['enable-logging']) # Disable DevTools logs
         browser_options.add_argument("--disable-usb") # fixes some error logs; remove if you really need USB
+        if config['_settings'].headless:
+            # No window - lighter with parallel sequences; a desktop-sized viewport keeps the page layout as usual
+            browser_options.add_argument("--headless=new")
+            browser_options.add_argument("--window-size=1920,1080")
         
-        # Add request blocking if configured
-        block_rules = []
+        # Add request blocking if configured (the URL patterns are built once in load_config)
+        block_rules = config['_block_rules']
         
-        # Built-in blockers for common services
-        if config['config'].get('block_ga4', False):
-            block_rules.extend([
-                "*google-analytics.com/*",
-                "*analytics.google.com/*",
-                "*googletagmanager.com/gtag/*"
-            ])
-            
-        if config['config'].get('block_gtm', False):
-            block_rules.append("*googletagmanager.com/*")
-            
-        if config['config'].get('block_piwik', False):
-            block_rules.append("*piwik.pro/*")
-            
-        # Add custom domain blocking
-        if 'block_domains' in config['config']:
-            custom_domains = config['config']['block_domains']
-            if isinstance(custom_domains, list):
-                for domain in custom_domains:
-                    if isinstance(domain, str):
-                        # Add both with and without www prefix
-                        clean_domain = domain.replace('http://', '').replace('https://', '').rstrip('/')
-                        block_rules.extend([
-                            f"*://{clean_domain}/*",
-                            f"*://*.{clean_domain}/*"
-                        ])
-                        logger.log(f"Added custom domain blocking for: {clean_domain}")
-                    else:
-                        logger.log(f"Warning: Invalid domain format in block_domains: {domain}", "ERROR")
-            else:
-                logger.log("Warning: block_domains must be a list", "ERROR")
-            
         if block_rules:
             browser_options.add_argument('--enable-features=NetworkService')
             browser_options.set_capability('goog:loggingPrefs', {'performance': 'ALL'})
@@ -1083,20 +1560,24 @@ def initialize_browser(config, logger):
         browser = webdriver.Chrome(options=browser_options)
         if block_rules:
             browser.execute_cdp_cmd('Network.enable', {})
-            browser.execute_cdp_cmd('Network.setBlockedURLs', {"urls": block_rules})
+            browser.execute_cdp_cmd('Network.setBlockedURLs', {"urls": list(block_rules)})
+        register_css(browser, config, logger)
         
         logger.log("Browser initialized successfully")
         return browser
         
     except Exception as e:
-        logger.log(f"Failed to initialize browser: {clean_error_message(e)}", "ERROR")
+        logger.log(f"Failed to initialize browser: {clean_error_message(e)}", level="ERROR")
         sys.exit(1)
 
 def get_element_locator(params, config):
     """
     Determine whether to use XPath or CSS selector for finding elements, then choose the right Selenium's By strategy.
-    Uses XPath if both are present.
+    Uses XPath if both are present. Step parameters have it resolved in load_config already.
     """
+    locator = params.get('_locator')
+    if locator is not None:
+        return locator
     if 'xpath' in params:
         return (By.XPATH, params['xpath'])
     elif 'selector' in params:
@@ -1104,77 +1585,131 @@ def get_element_locator(params, config):
     else:
         raise ValueError("No valid selector found in parameters - must be either 'xpath' or 'selector'")
 
-def has_dimensions(element):
-    """Validate if element has non-zero dimensions"""
-    try:
-        return element.size['height'] > 0 and element.size['width'] > 0
-    except:
-        return False
+# Finds the elements matching a locator and keeps those with non-zero width and height - one script call for
+# the whole list. Returns [number of matches, elements with dimensions]
+FIND_WITH_DIMENSIONS_SCRIPT = """
+    const [by, value] = arguments;
+    let elements;
+    if (by === 'xpath') {
+        const result = document.evaluate(value, document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+        elements = Array.from({length: result.snapshotLength}, (_, i) => result.snapshotItem(i));
+    } else {
+        elements = Array.from(document.querySelectorAll(value));
+    }
+    return [elements.length, elements.filter(element => {
+        if (element.nodeType !== Node.ELEMENT_NODE) return false;
+        const rect = element.getBoundingClientRect();
+        return rect.width > 0 && rect.height > 0;
+    })];
+"""
+
+def find_elements_with_dimensions(browser, by_strategy, selector):
+    """
+    Find the matching elements and keep only those with non-zero dimensions, in one script call.
+    Returns (number of matches, elements with dimensions), or None when nothing matches.
+    """
+    match_count, elements = browser.execute_script(FIND_WITH_DIMENSIONS_SCRIPT, by_strategy, selector)
+    return (match_count, elements) if match_count else None
+
+# Walks up from the element to <body> in the page, returns false if any of them has the 'hidden' attribute.
+# At the top of a shadow tree the walk continues from its host element, so elements inside web components work too.
+# Then checks the element itself is enabled (':disabled' covers disabled fieldsets too, like WebDriver's is_enabled)
+CLICKABLE_SCRIPT = """
+    let current = arguments[0];
+    while (current && current.tagName) {
+        if (current.hasAttribute('hidden')) return false;
+        if (current.tagName.toLowerCase() === 'body') break;
+        current = current.parentElement || current.getRootNode().host;
+    }
+    return !arguments[0].matches(':disabled');
+"""
 
 def is_element_clickable(element):
     """Detailed check for an element to click"""
     try:
-        # Check if element or its parents have 'hidden' attribute
-        current = element
-        while current:
-            if current.get_attribute('hidden') is not None:
-                return False
-            if current.tag_name == 'body':
-                break
-            current = current.find_element(By.XPATH, '..')
-        
-        return element.is_enabled()
+        # Hidden ancestors and the enabled state are checked in one script call
+        return element.parent.execute_script(CLICKABLE_SCRIPT, element) is True
     except:
         return False
 
-def wait_for_element(browser, params, config, logger):
+# Polls the page for all locators at once, so a whole batch of elements costs a single WebDriver round-trip
+WAIT_FOR_ALL_SCRIPT = """
+    const locators = arguments[0];
+    const deadline = Date.now() + arguments[1];
+    const done = arguments[arguments.length - 1];
+    const find = ([by, value]) => by === 'xpath'
+        ? document.evaluate(value, document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue
+        : document.querySelector(value);
+    (function poll() {
+        let missing;
+        try {
+            missing = locators.filter(locator => !find(locator)).map(locator => locator[1]);
+        } catch (e) {
+            done({error: String(e)});
+            return;
+        }
+        if (!missing.length || Date.now() > deadline) {
+            done(missing);
+            return;
+        }
+        setTimeout(poll, 100);
+    })();
+"""
+
+def wait_for_all(browser, locators, timeout, logger):
+    """Wait until every (By strategy, selector) locator matches an element; returns the selectors still missing"""
+    if not locators:
+        return []
+    logger.log("Waiting for %d elements in a single batch", len(locators))
+    browser.set_script_timeout(timeout + 5)  # leave room for the in-page deadline
+    result = browser.execute_async_script(WAIT_FOR_ALL_SCRIPT, [list(locator) for locator in locators], int(timeout * 1000))
+    if isinstance(result, dict):
+        raise Exception(f"Invalid selector in batch: {result.get('error')}")
+    return result
+
+def wait_for_element(browser, params, config, logger, wait_for_presence=True):
     """Wait for element (with default randomized selection when multiple elements match)"""
-    timeout = config['config'].get('default_timeout', 10) # default timeout
+    timeout = config['_settings'].default_timeout
     max_elements = 50  # Threshold for "too many elements" warning
+    by_strategy, selector = None, params.get('xpath', params.get('selector'))
     
     try:
         by_strategy, selector = get_element_locator(params, config) # get_element_locator returns a tuple with two values
-        logger.log(f"Waiting for elements matching: {selector}")
+        logger.log("Waiting for elements matching: %s", selector)
         
-        # First wait for presence
-        WebDriverWait(browser, timeout).until(
-            EC.presence_of_element_located((by_strategy, selector))
-        )
-        
-        # Get all matching elements
-        elements = browser.find_elements(by_strategy, selector)
-        if not elements:
+        # Wait for presence and get the matching elements with non-zero width/height in the same query
+        # (no waiting when the caller already waited for a whole batch)
+        if wait_for_presence:
+            found = WebDriverWait(browser, timeout).until(
+                lambda driver: find_elements_with_dimensions(driver, by_strategy, selector)
+            )
+        else:
+            found = find_elements_with_dimensions(browser, by_strategy, selector)
+        if not found:
             raise Exception(f"No elements found matching: {selector}")
             
-        # Quick filter exclude elements with 0 width/height
-        candidates = [e for e in elements if has_dimensions(e)]
+        match_count, candidates = found
         total_matches = len(candidates)
-        logger.log(f"{total_matches} out of {len(elements)} matches qualified")
+        logger.log("%d out of %d matches qualified", total_matches, match_count)
         
         if total_matches > max_elements:
             warning_msg = f"Warning: Selector '{selector}' matches {total_matches} elements - consider using a more specific selector"
-            logger.log(warning_msg, "ERROR")
+            logger.log(warning_msg, level="ERROR")
         
         if not candidates:
             raise Exception(f"No visible elements found matching: {selector}")
         
-        # Try up to 5 random elements
-        for attempt in range(5):
-            if len(candidates) == 0:
-                raise Exception("No more candidates available after failed attempts")
-                
-            # Pick a random element
-            element = random.choice(candidates)
-            
+        # Try up to 5 random elements - drawn at once, so none is tried twice and the list is never modified
+        picked = random_sample(candidates, min(5, total_matches))
+        for attempt, element in enumerate(picked, 1):
             # Detailed check for this element only
             if not is_element_clickable(element):
-                candidates.remove(element)
-                logger.log(f"🔎 Selected element not clickable, trying another ({len(candidates)} remaining)", "INFO")
+                logger.log(f"🔎 Selected element not clickable, trying another ({total_matches - attempt} remaining)", level="INFO")
                 continue
             
             # If element needs scrolling
             if not element.is_displayed():
-                logger.log("🔎 Selected element not in viewport, scrolling into view", "INFO")
+                logger.log("🔎 Selected element not in viewport, scrolling into view", level="INFO")
                 browser.execute_script("""
                     arguments[0].scrollIntoView({
                         block: 'center',
@@ -1188,74 +1723,229 @@ def wait_for_element(browser, params, config, logger):
                 WebDriverWait(browser, 3).until(  # Short timeout for final check
                     lambda driver: element.is_displayed() and element.is_enabled()
                 )
-                logger.log("🎯 Element is now visible and clickable", "INFO")
+                logger.log("🎯 Element is now visible and clickable", level="INFO")
                 return element
             except:
-                candidates.remove(element)
-                logger.log("🔎 Element is not clickable after scroll, trying another one", "INFO")
+                logger.log("🔎 Element is not clickable after scroll, trying another one", level="INFO")
                 continue
                 
+        if len(picked) < 5:
+            raise Exception("No more candidates available after failed attempts")
         if total_matches > max_elements:
             raise Exception(f"Selector '{selector}' matches too many elements ({total_matches}). Could not find clickable element after 5 attempts. Consider using a more specific selector")
         else:
             raise Exception("Could not find clickable element after 5 attempts")
         
     except Exception as e:
-        page_source = browser.page_source # Get page source for debugging
-        if selector in page_source:
-            logger.log(f"Element found in page source but not interactable", "ERROR")
+        # Probe the DOM for the selector instead of downloading the whole page source
+        if by_strategy is not None and element_exists(browser, by_strategy, selector):
+            logger.log(f"Element found in the page but not interactable", level="ERROR")
         else:
-            logger.log(f"Element not found in the page source", "ERROR")
+            logger.log(f"Element not found in the page", level="ERROR")
         raise Exception(f"Error: Element not found or not clickable: {selector}")
+
+def element_exists(browser, by_strategy, selector):
+    """Check in a single script call whether any element matches the locator"""
+    try:
+        if by_strategy == By.XPATH:
+            return browser.execute_script(
+                "return document.evaluate(arguments[0], document, null, XPathResult.BOOLEAN_TYPE, null).booleanValue",
+                selector
+            )
+        return browser.execute_script("return !!document.querySelector(arguments[0])", selector)
+    except Exception:
+        return False
+    
+# Adds the stylesheet given in arguments[0] once per page; returns true only when it was added by this call
+INJECT_CSS_SCRIPT = """
+    if (document.getElementById('custom-css-hide-elements')) return false;
+    let styleSheet = document.createElement("style");
+    styleSheet.type = "text/css";
+    styleSheet.id = "custom-css-hide-elements";
+    styleSheet.innerText = arguments[0];
+    document.head.appendChild(styleSheet);
+    return true;
+"""
+
+# Source of the script run by the browser in every new document, before the page's own scripts: adds the stylesheet
+# (with the id checked by INJECT_CSS_SCRIPT) as soon as the document element exists
+HIDE_CSS_NEW_DOCUMENT_SCRIPT = """
+(function () {
+    const add = () => {
+        if (document.getElementById('custom-css-hide-elements')) return;
+        const styleSheet = document.createElement('style');
+        styleSheet.id = 'custom-css-hide-elements';
+        styleSheet.textContent = %s;
+        (document.head || document.documentElement).appendChild(styleSheet);
+    };
+    if (document.documentElement) {
+        add();
+    } else {
+        new MutationObserver((records, observer) => {
+            if (!document.documentElement) return;
+            observer.disconnect();
+            add();
+        }).observe(document, {childList: true});
+    }
+})();
+"""
+
+# Browsers which add the CSS to every new document by themselves - inject_css has nothing to do for them
+_CSS_REGISTERED_BROWSERS = weakref.WeakSet()
+
+def register_css(browser, config, logger):
+    """Let the browser add the CSS rules to every page it loads, instead of injecting them after each step"""
+    css_rules = config['_settings'].hide_css
+    if not css_rules:
+        return
     
+    try:
+        browser.execute_cdp_cmd('Page.addScriptToEvaluateOnNewDocument', {
+            'source': HIDE_CSS_NEW_DOCUMENT_SCRIPT % json.dumps(css_rules)
+        })
+        _CSS_REGISTERED_BROWSERS.add(browser)
+        logger.log("CSS rules registered for every new page")
+    except Exception as e:  # inject_css still adds them after each step
+        logger.log(f"Warning: Failed to register CSS rules: {clean_error_message(e)}", level="ERROR")
+
 def inject_css(browser, config, logger):
     """Inject CSS rules to hide specified elements"""
-    css_elements_to_hide = config['config'].get('css_elements_to_hide', [])
-    css_rules = "\n".join([f"{selector} {{ display: none !important; }}" for selector in css_elements_to_hide])
-
-    if css_rules:
-        try:
-            browser.execute_script(f"""
-                if (!document.getElementById('custom-css-hide-elements')) {{
-                    let styleSheet = document.createElement("style");
-                    styleSheet.type = "text/css";
-                    styleSheet.id = "custom-css-hide-elements";
-                    styleSheet.innerText = `{css_rules}`;
-                    document.head.appendChild(styleSheet);
-                }}
-            """)
+    css_rules = config['_settings'].hide_css  # built once in load_config
+    if not css_rules or browser in _CSS_REGISTERED_BROWSERS:
+        return
+    
+    try:
+        if browser.execute_script(INJECT_CSS_SCRIPT, css_rules):
             logger.log("CSS rules injected")
-        except Exception as e:
-            logger.log(f"Warning: Failed to inject CSS rules: {clean_error_message(e)}", "ERROR")
+    except Exception as e:
+        logger.log(f"Warning: Failed to inject CSS rules: {clean_error_message(e)}", level="ERROR")
+
+SANITIZE_SCALAR_TYPES = frozenset((str, int, float, bool, type(None)))
+SANITIZE_SKIPPED_KEYS = frozenset(('error', 'trace'))  # error objects and stack traces
+
+def needs_sanitizing(event_data):
+    """Check whether the data has anything sanitize_event_data would change - a scan without building any copies"""
+    stack = [event_data]
+    while stack:
+        value = stack.pop()
+        if type(value) in SANITIZE_SCALAR_TYPES:
+            continue
+        if type(value) is dict:
+            for k, v in value.items():
+                if k in SANITIZE_SKIPPED_KEYS or type(k) is not str:
+                    return True
+                if type(v) not in SANITIZE_SCALAR_TYPES:
+                    stack.append(v)
+        elif type(value) is list:
+            stack.extend(value)
+        else:  # anything else is converted to a string
+            return True
+    return False
 
 def sanitize_event_data(event_data):
-    """Clean data from unnecessary elements"""
+    """
+    Clean data from unnecessary elements - events are parsed from the dataLayer JSON, so only JSON types occur
+    (DOM nodes are already left out when the page serializes them)
+    """
     try:
-        if isinstance(event_data, dict):
-            return {
-                k: sanitize_event_data(v) 
-                for k, v in event_data.items() 
-                if not str(type(v)).find('selenium') > -1  # Skip Selenium objects
-                and k != 'error'  # Skip error objects
-                and k != 'trace'  # Skip stack traces
-            }
-        elif isinstance(event_data, list):
-            return [sanitize_event_data(item) for item in event_data]
-        elif isinstance(event_data, (str, int, float, bool, type(None))):
+        # Events parsed from the dataLayer JSON are usually clean already - they are used as they are then
+        if not needs_sanitizing(event_data):
             return event_data
-        else:
-            return str(event_data)
+        
+        # Walk the structure with an explicit stack - each item is (value, parent container, key or index in it)
+        root = [None]
+        stack = [(event_data, root, 0)]
+        while stack:
+            value, parent, key = stack.pop()
+            if type(value) in SANITIZE_SCALAR_TYPES:
+                parent[key] = value
+            elif isinstance(value, dict):
+                clean = parent[key] = {}
+                for k, v in value.items():
+                    if k in SANITIZE_SKIPPED_KEYS:
+                        continue
+                    clean[k] = None  # reserve the slot, so the original key order is kept
+                    stack.append((v, clean, k))
+            elif isinstance(value, list):
+                clean = parent[key] = [None] * len(value)
+                stack.extend((item, clean, i) for i, item in enumerate(value))
+            elif isinstance(value, (str, int, float, bool)):
+                parent[key] = value
+            else:
+                try:
+                    parent[key] = str(value)
+                except Exception as e:
+                    parent[key] = f"Error sanitizing data: {clean_error_message(e)}"
+        return root[0]
     except Exception as e:
         return f"Error sanitizing data: {clean_error_message(e)}"
 
-def start_monitoring_thread(browser, monitored_events, event_queue, stop_event, logger, config):
-    """Monitor dataLayer thread"""
-    processed_events = set()
+def freeze_event_data(event_data):
+    """Convert sanitized event data into nested tuples, hashable without serializing it to JSON"""
+    if isinstance(event_data, dict):
+        return tuple(sorted((k, freeze_event_data(v)) for k, v in event_data.items()))
+    elif isinstance(event_data, list):
+        return tuple(freeze_event_data(item) for item in event_data)
+    return event_data
+
+# Returns only the dataLayer entries added since the previous poll. The read position is kept on the page
+# (it starts from 0 again after navigation or when dataLayer is replaced) under a name given in arguments[0],
+# one per monitoring thread.
+# Reading by position also works when GTM or other scripts replace dataLayer.push with their own function.
+# Returns [page URL, new dataLayer entries, number of skipped entries] as one JSON string - the browser serializes it
+# natively and the driver only passes a string through, instead of walking every event object. DOM nodes (and window)
+# are left out of the events. Each entry is serialized on its own, so one that can't be (a circular structure, BigInt)
+# is skipped without losing the others, and the cursor only moves once all of them are done
+DATALAYER_POLL_SCRIPT = """
+    const href = window.location.href;
+    const dataLayer = window.dataLayer;
+    if (dataLayer === undefined || dataLayer === null) return JSON.stringify([href, [], 0]);
+    if (!Array.isArray(dataLayer)) return JSON.stringify([href, null, 0]);
+    const sourceName = arguments[0] + '_source';
+    let start = window[arguments[0]] || 0;
+    if (window[sourceName] !== dataLayer || dataLayer.length < start) {
+        // dataLayer was replaced by another array (or shortened) - read it from the beginning,
+        // events already seen in the previous array are skipped by deduplication
+        start = 0;
+    }
+    const end = dataLayer.length;
+    const skipDomNodes = (key, value) => value instanceof Node || value === window ? undefined : value;
+    const entries = [];
+    let skipped = 0;
+    for (let i = start; i < end; i++) {
+        try {
+            const entry = JSON.stringify(dataLayer[i], skipDomNodes);
+            if (entry !== undefined) entries.push(entry);
+        } catch (e) {
+            skipped++;
+        }
+    }
+    window[sourceName] = dataLayer;
+    window[arguments[0]] = end;
+    return '[' + JSON.stringify(href) + ',[' + entries.join(',') + '],' + skipped + ']';
+"""
+
+PROCESSED_EVENTS_LIMIT = 4096  # default number of distinct events remembered for deduplication (processed_events_limit)
+
+def start_monitoring_thread(browser, monitored_events, event_queue, stop_event, logger, config, event_waiters=None,
+                            reset_request=None, reset_done=None):
+    """
+    Monitor dataLayer thread (event_waiters: event name -> Event to set when that event is queued).
+    When reset_request is set, the deduplication window is cleared before the next poll and reset_done is set.
+    """
+    # Bounded LRU of hashes of seen events (values unused). Entries are read from dataLayer by position, so each one
+    # is seen once anyway - the window only has to cover repeated pushes of the same event
+    processed_events = OrderedDict()
+    processed_events_limit = config['config'].get('processed_events_limit', PROCESSED_EVENTS_LIMIT)
     error_cooldown = 0
     last_valid_url = None
+    cursor_name = f"__omdl_cursor_{id(stop_event)}"
+    ts_second, ts_str = None, None  # the last formatted timestamp (whole seconds)
     
-    # Get validation rules from config
-    validation_rules = config.get('validation', {})
+    # Get validation rules from config (compiled in load_config) - without any rules, nothing is validated
+    validation_rules = config.get('_compiled_validation') or None
+    # Set lookup for the tracked event names (None tracks all events)
+    monitored_events = frozenset(monitored_events) if monitored_events else None
 
     # Get the initial URL from the first visit step in the first sequence
     initial_url = None
@@ -1267,241 +1957,381 @@ def start_monitoring_thread(browser, monitored_events, event_queue, stop_event,
             url = first_step['url']
             initial_url = url[0] if isinstance(url, list) else url
     except Exception as e:
-        logger.log(f"Warning: Could not get initial URL from config: {clean_error_message(e)}", "ERROR")
+        logger.log(f"Warning: Could not get initial URL from config: {clean_error_message(e)}", level="ERROR")
         initial_url = "Initializing page"
     
     while not stop_event.is_set():
+        if reset_request is not None and reset_request.is_set():
+            # A new sequence starts - events it shares with the previous one must not be skipped as duplicates
+            reset_request.clear()
+            processed_events.clear()
+            reset_done.set()
+        
         try:
             # Only proceed if browser is still responsive
             if not browser or error_cooldown > 0:
                 error_cooldown = max(0, error_cooldown - 1)
-                time.sleep(0.5)
+                stop_event.wait(0.5)  # returns as soon as the monitor is stopped
                 continue
                 
-            current_url = browser.current_url
+            # The URL comes with the events - one driver call per poll
+            current_url, datalayer, skipped = load_json(browser.execute_script(DATALAYER_POLL_SCRIPT, cursor_name))
+            if skipped:
+                logger.log(f"Warning: {skipped} dataLayer entries could not be serialized (e.g. circular references) - skipped", level="ERROR")
             if not current_url.startswith('data:'):
                 last_valid_url = current_url
                 
             # Use last_valid_url if available, otherwise use initial_url from config
             url_to_log = last_valid_url or initial_url
-                
-            datalayer = browser.execute_script("return window.dataLayer || []")
             
             if not isinstance(datalayer, list):
-                logger.log("Warning: dataLayer is not a list", "ERROR")
+                logger.log("Warning: dataLayer is not a list", level="ERROR")
+                stop_event.wait(0.1)  # don't poll again without a pause
                 continue
-                
+            
+            dropped = 0  # events that didn't fit in the queue during this poll
             for event in datalayer:
                 if not isinstance(event, dict) or 'event' not in event:
                     continue
                     
                 try:
+                    # Untracked events are skipped before any sanitizing or hashing
+                    if monitored_events is not None and event['event'] not in monitored_events:
+                        continue
+                    
                     sanitized_event = sanitize_event_data(event)
-                    event_id = f"{event['event']}_{hash(json.dumps(sanitized_event, sort_keys=True))}"
+                    # Only the hash is kept - a 64-bit int instead of the whole frozen event in the LRU
+                    event_id = hash((event['event'], freeze_event_data(sanitized_event)))
                     
-                    if event_id in processed_events or (monitored_events and event['event'] not in monitored_events):
+                    if event_id in processed_events:
+                        processed_events.move_to_end(event_id)  # recently seen again, keep it longer
                         continue
                     
-                    valid_flag = None
-                    error_details = None
                     is_valid = None
-                    errors = []
-
-                    if validation_rules:
-                        event_name = event['event']
-                        rule_for_event = validation_rules.get(event_name, {})
-                        if rule_for_event:
-                            is_valid, errors = validate_event(sanitized_event, rule_for_event)
-                            valid_flag = "✔️" if is_valid else "❌"
-                            error_details = errors if not is_valid else None
-                        else:
-                            valid_flag = "-"
-                            error_details = None
-                    else:
-                        valid_flag = "-"
-                        error_details = None
+                    valid_flag = "-"
+                    error_details = None
 
-                    # Add validation result to the event record
-                    event_queue.put({
+                    rule_for_event = validation_rules.get(event['event']) if validation_rules else None
+                    if rule_for_event:
+                        is_valid, errors = validate_event(sanitized_event, rule_for_event)
+                        valid_flag = "✔️" if is_valid else "❌"
+                        error_details = errors if not is_valid else None
+
+                    # Add validation result to the event record - output strings are formatted here, between polls,
+                    # so the step thread only has to copy them into the results
+                    now = time.time()
+                    if int(now) != ts_second:  # events come in bursts - format each second only once
+                        ts_second = int(now)
+                        ts_str = time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(ts_second))
+                    record = {
                         'event_name': event['event'],
-                        'event_data': sanitized_event,
-                        'timestamp': datetime.now(),
+                        'timestamp': datetime.fromtimestamp(now),
+                        'ts_str': ts_str,
                         'url': url_to_log,
+                        'data_json': dump_json_pretty(sanitized_event), # Indented for better formatting, non-ASCII characters are kept as they are
                         'valid': valid_flag,
-                        'error_details': error_details
-                    })
+                        'error_json': dump_json_pretty(error_details) if error_details else "-"
+                    }
+                    try:
+                        event_queue.put_nowait(record)  # the queue is bounded - the monitor never waits for the steps
+                    except Full:
+                        dropped += 1
+                    else:
+                        waiter = event_waiters.get(event['event']) if event_waiters else None
+                        if waiter is not None:
+                            waiter.set()  # a step waits for this event - end its delay
                     
-                    processed_events.add(event_id)
+                    processed_events[event_id] = None
+                    if len(processed_events) > processed_events_limit:
+                        processed_events.popitem(last=False)  # forget the oldest event
+                        logger.log("Deduplication window full (%s events) - the oldest event was forgotten", processed_events_limit)
 
                     if is_valid is True:
-                        logger.log(f"✅ Valid event: {event['event']}")
+                        logger.log("✅ Valid event: %s", event['event'])
                     elif is_valid is False:
-                        logger.log(f"⚠️  Invalid event: {event['event']}", "ERROR")
+                        logger.log(f"⚠️  Invalid event: {event['event']}", level="ERROR")
                     else:
-                        logger.log(f"🟦 Not validated (no rule): {event['event']}")
+                        logger.log("🟦 Not validated (no rule): %s", event['event'])
 
                 except Exception as inner_e:
-                    logger.log(f"Error processing event: {clean_error_message(inner_e)}", "ERROR")
+                    logger.log(f"Error processing event: {clean_error_message(inner_e)}", level="ERROR")
+            
+            if dropped:
+                logger.log(f"Warning: event queue is full (event_queue_max) - {dropped} events dropped", level="ERROR")
                     
         except Exception as e:
             error_msg = clean_error_message(e)
-            logger.log(f"Error in monitoring thread: {error_msg}", "ERROR")
+            logger.log(f"Error in monitoring thread: {error_msg}", level="ERROR")
             error_cooldown = 10  # Add cooldown period after error
             
-        time.sleep(0.1)
+        stop_event.wait(0.1)  # poll interval - interrupted immediately when the monitor is stopped
 
-def process_queued_events(event_queue, log_data, current_step, logger, until_time=None):
-    """Process events from queue until specified time"""
-    while not event_queue.empty():
+def process_queued_events(event_queue, carry_over, log_data, current_step, logger, until_time=None):
+    """
+    Process events from queue until specified time.
+    carry_over is a deque owned by the sequence: the first event after until_time is kept there for the next step
+    (and processed before the queue then), later events simply stay in the queue - the monitor queues them in order.
+    """
+    while True:
+        if carry_over:
+            event = carry_over.popleft()
+        else:
+            try:
+                event = event_queue.get_nowait()
+            except Empty:
+                break
+        
         try:
-            event = event_queue.get_nowait()
             # If until_time is specified, only process events that occurred before it
             if until_time and event['timestamp'] > until_time:
-                # Put the event back in the queue for the next step
-                event_queue.put(event)
+                # Keep the event for the next step - the queue is not touched again, nor put back into
+                carry_over.appendleft(event)
                 break
                 
             log_data.append([
                 current_step,
                 event['event_name'],
-                event['timestamp'].strftime('%Y-%m-%d %H:%M:%S'),
+                event['ts_str'],
                 event['url'],
-                json.dumps(event['event_data'], indent=2, ensure_ascii=False) , # Added indentation for better formatting and ensure_ascii=False to display non-ASCII characters
+                event['data_json'],
                 event['valid'],
-                json.dumps(event.get('error_details', '-'), indent=2, ensure_ascii=False) if event.get('error_details') else "-"
+                event['error_json']
             ])
         except Exception as e:
-            logger.log(f"Error processing event from queue: {clean_error_message(e)}", "ERROR")
-
-def perform_action(browser, action_type, params, config, logger):
-    """Perform a single browser action - visit, click, form, scroll"""
+            logger.log(f"Error processing event from queue: {clean_error_message(e)}", level="ERROR")
+
+# Scrolls the page - to an element, by pixels or to a percentage of the page height - then resolves once the scroll
+# position hasn't changed for three reads in a row (50 ms apart) or after the timeout given in milliseconds.
+# A smooth scroll may need a moment to start, so a single unchanged read is not enough
+SCROLL_SCRIPT = """
+    const [mode, target, timeout] = arguments;
+    const done = arguments[arguments.length - 1];
+    if (mode === 'element') {
+        target.scrollIntoView({block: 'center', behavior: 'smooth'});
+    } else if (mode === 'pixels') {
+        window.scrollBy(0, target);
+    } else {
+        const pageHeight = Math.max(document.body.scrollHeight, document.documentElement.scrollHeight);
+        window.scrollTo(0, pageHeight * target / 100);
+    }
     
-    def do_click(element, browser, method="selenium"):
-        """Provide different methods of clicking an element."""
-        if method == "selenium":
+    const deadline = Date.now() + timeout;
+    let last = window.scrollY, stableReads = 0;
+    (function poll() {
+        const position = window.scrollY;
+        stableReads = position === last ? stableReads + 1 : 0;
+        last = position;
+        if (stableReads >= 3 || Date.now() > deadline) {
+            done(position);
+            return;
+        }
+        setTimeout(poll, 50);
+    })();
+"""
+
+def scroll_page(browser, mode, target, settle_timeout, logger):
+    """Scroll ('element', 'pixels' or 'percentage') and wait (up to settle_timeout seconds) until the page stops, in one script call"""
+    browser.set_script_timeout(settle_timeout + 5)  # leave room for the in-page deadline
+    position = browser.execute_async_script(SCROLL_SCRIPT, mode, target, int(settle_timeout * 1000))
+    logger.log("Scroll settled at %s px", position)
+
+# Sets the values of form fields given as [by, locator, value] - for each one the first visible match (or the first
+# match) is used. The setter of the element's prototype is called, so inputs controlled by frameworks (e.g. React)
+# notice the change, then input and change events are sent. Stops at the first missing field and returns its index,
+# or null when all fields were filled
+FILL_FIELDS_SCRIPT = """
+    for (const [index, [by, locator, value]] of arguments[0].entries()) {
+        let elements;
+        if (by === 'xpath') {
+            const result = document.evaluate(locator, document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+            elements = Array.from({length: result.snapshotLength}, (_, i) => result.snapshotItem(i));
+        } else {
+            elements = Array.from(document.querySelectorAll(locator));
+        }
+        const element = elements.find(element => {
+            const rect = element.getBoundingClientRect();
+            return rect.width > 0 && rect.height > 0;
+        }) || elements[0];
+        if (!element) return index;
+        
+        const property = Object.getOwnPropertyDescriptor(Object.getPrototypeOf(element), 'value');
+        if (property && property.set) {
+            property.set.call(element, value);
+        } else {
+            element.value = value;
+        }
+        element.dispatchEvent(new Event('input', {bubbles: true}));
+        element.dispatchEvent(new Event('change', {bubbles: true}));
+    }
+    return null;
+"""
+
+def do_click(element, browser, method="selenium"):
+    """Provide different methods of clicking an element."""
+    if method == "selenium":
+        try:
+            element.click()
+        except Exception:
+            browser.execute_script("arguments[0].click();", element)
+    elif method == "js":
+        browser.execute_script("arguments[0].click();", element)
+    elif method == "action":
+        ActionChains(browser).move_to_element(element).click().perform()
+    else:
+        raise ValueError(f"Unsupported click_method: {method}")
+
+def perform_scroll(browser, params, config, logger):
+    """Scroll to an element, by pixels or to a percentage of the page"""
+    if 'selector' in params or 'xpath' in params:
+        element = wait_for_element(browser, params, config, logger)
+        logger.log(f"➡️ Scrolling to element", level="INFO")
+        mode, target = 'element', element
+    elif 'pixels' in params:
+        scroll_amount = params['pixels']
+        logger.log(f"➡️ Scrolling by {scroll_amount} pixels", level="INFO")
+        mode, target = 'pixels', scroll_amount
+    elif 'percentage' in params:
+        scroll_percentage = params['percentage']
+        logger.log(f"➡️ Scrolling to {scroll_percentage}% of page", level="INFO")
+        mode, target = 'percentage', scroll_percentage
+    else:
+        raise ValueError("Scroll step must specify either 'selector', 'xpath', 'pixels', or 'percentage'")
+
+    # The script also waits for the scroll animation to end (not the configured delay)
+    scroll_page(browser, mode, target, config['_settings'].scroll_settle_timeout, logger)
+    return f"Scrolled page successfully"
+
+def perform_visit(browser, params, config, logger):
+    """Load the step's URL (a random one if there are more), or only mark a page view"""
+    if 'url' not in params:
+        logger.log("Step marked as page view without navigation")
+        return "Page view step (no navigation)"
+    else:
+        final_url = random_choice(params['_urls'])  # built in load_config
+        browser.get(final_url)
+
+        try:
+            WebDriverWait(browser, config['_settings'].default_timeout).until(
+                lambda driver: driver.execute_script('return document.readyState') == 'complete'
+            )
+            logger.log(f"➡️  Current URL: {browser.current_url}", level="INFO")
+            logger.log("Page load completed")
+            inject_css(browser, config, logger)
+        except Exception as e:
+            logger.log(f"Warning: Page load wait timed out: {clean_error_message(e)}", level="ERROR")
+
+        # Verify we're not on a blank/transitional page
+        if browser.current_url.startswith('data:'):
+            logger.log("Warning: URL is not saved correctly for page navigation", level="ERROR")
+
+        return f"Visited URL: {final_url}"
+
+def perform_clicks(browser, params, config, logger):
+    """Click the step's elements in order"""
+    clicks = params.get('clicks', [])
+    if not clicks:
+        raise ValueError("Click step must contain a 'clicks' list")
+
+    default_delay = config['_settings'].default_delay
+    last_click = len(clicks) - 1
+    success_count = 0
+    for i, click_params in enumerate(clicks):
+        try:
+            # Only call wait_for_element once per click attempt
+            element = wait_for_element(browser, click_params, config, logger)
+
             try:
                 element.click()
-            except Exception:
+            except Exception as e:
                 browser.execute_script("arguments[0].click();", element)
-        elif method == "js":
-            browser.execute_script("arguments[0].click();", element)
-        elif method == "action":
-            ActionChains(browser).move_to_element(element).click().perform()
-        else:
-            raise ValueError(f"Unsupported click_method: {method}")
+
+            selector = get_element_locator(click_params, config)[1]  # resolved in load_config, no lookups repeated
+            logger.log(f"➡️  Clicked element {i+1}: {selector}" , level="INFO")
+            success_count += 1
+
+            # Handle delay between individual clicks
+            if i < last_click:  # Don't delay after last click
+                delay = click_params.get('delay_after', default_delay)
+                if delay > 0:
+                    logger.log("Waiting %s seconds between clicks...", delay)
+                    time.sleep(delay)
+        except Exception as click_error:
+            logger.log(f"Failed to click element {i+1}: {clean_error_message(click_error)}", level="ERROR")
+            continue
+
+    if success_count == 0:
+        raise Exception("All clicks in step failed")
+    elif success_count < len(clicks):
+        return f"Completed {success_count} out of {len(clicks)} clicks"
+    else:
+        return "All clicks completed successfully"
+
+FORM_BATCH_TIMEOUT = 2  # seconds - the longest wait for all fields at once, before they're waited for one by one
+
+def perform_form(browser, params, config, logger):
+    """Fill in the form fields and submit the form"""
+    submit_method = params.get('submit_method', 'selenium')
+    submit_params = params.get('_submit') or {'xpath': params['submit_button']}
+    fields = params['fields']
+
+    fill_method = params.get('fill_method', 'selenium')
+    if fill_method == 'selenium':
+        # Fast path: usually all fields are on the page at once, so wait for them in a single batch (shortly).
+        # Fields still missing then - e.g. shown only after another field is filled - get their own full wait
+        locators = [get_element_locator(field, config) for field in fields]
+        timeout = min(config['_settings'].default_timeout, FORM_BATCH_TIMEOUT)
+        missing = set(wait_for_all(browser, locators, timeout, logger))
+        for field, locator in zip(fields, locators):
+            element = wait_for_element(browser, field, config, logger, wait_for_presence=locator[1] in missing)
+            element.clear()  # clear input before filling in
+            element.send_keys(field['value'])
+    elif fill_method == 'js':
+        # The fields are filled in one script call - values are set directly, without key presses. The script stops at
+        # the first missing field, which is then waited for, and the remaining fields are filled in the next call
+        values = [[*get_element_locator(field, config), str(field['value'])] for field in fields]
+        start = 0
+        while start < len(fields):
+            missing_index = browser.execute_script(FILL_FIELDS_SCRIPT, values[start:])
+            if missing_index is None:
+                break
+            start += missing_index
+            wait_for_element(browser, fields[start], config, logger)  # raises when the field doesn't show up
+    else:
+        raise ValueError(f"Unsupported fill_method: {fill_method}")
     
+    # The submit button may be shown or enabled only after the fields are filled, so it's waited for now
+    submit_button = wait_for_element(browser, submit_params, config, logger)
+    do_click(submit_button, browser, submit_method) # click the submit button with the specified method
+    return "Form submitted successfully"
+
+# Step type -> action taking (browser, params, config, logger) and returning a result message
+STEP_ACTIONS = {
+    'visit': perform_visit,
+    'click': perform_clicks,
+    'form': perform_form,
+    'scroll': perform_scroll,
+}
+
+def perform_action(browser, action_type, params, config, logger):
+    """Perform a single browser action - visit, click, form, scroll"""
     try:
+        action = STEP_ACTIONS.get(action_type)
+        if action is None:
+            raise ValueError(f"Unknown step type '{action_type}'")
         if action_type != 'visit':
-            logger.log(f"➡️  Current URL: {browser.current_url}", "INFO")
-
-        if action_type == 'scroll':
-            if 'selector' in params or 'xpath' in params:
-                element = wait_for_element(browser, params, config, logger)
-                logger.log(f"➡️ Scrolling to element", "INFO")
-                browser.execute_script("arguments[0].scrollIntoView({block: 'center', behavior: 'smooth'});", element)
-            elif 'pixels' in params:
-                scroll_amount = params['pixels']
-                logger.log(f"➡️ Scrolling by {scroll_amount} pixels", "INFO")
-                browser.execute_script(f"window.scrollBy(0, {scroll_amount});")
-            elif 'percentage' in params:
-                scroll_percentage = params['percentage']
-                logger.log(f"➡️ Scrolling to {scroll_percentage}% of page", "INFO")
-                browser.execute_script(f"""
-                    let pageHeight = Math.max(
-                        document.body.scrollHeight,
-                        document.documentElement.scrollHeight
-                    );
-                    window.scrollTo(0, pageHeight * {scroll_percentage / 100});
-                """)
-            else:
-                raise ValueError("Scroll step must specify either 'selector', 'xpath', 'pixels', or 'percentage'")
-                
-            # Short wait for scroll completion
-            time.sleep(1)  # This is just for scroll animation, not the configured delay
-            return f"Scrolled page successfully"
-
-        elif action_type == 'visit':
-            if 'url' not in params:
-                logger.log("Step marked as page view without navigation")
-                return "Page view step (no navigation)"
-            else:
-                url = random.choice(params['url']) if isinstance(params['url'], list) else params['url']
-                final_url = url + "?bot=true" if config['config'].get('bot_info', False) else url
-                browser.get(final_url)
-                
-                try:
-                    WebDriverWait(browser, config['config'].get('default_timeout', 10)).until(
-                        lambda driver: driver.execute_script('return document.readyState') == 'complete'
-                    )
-                    logger.log(f"➡️  Current URL: {browser.current_url}", "INFO")
-                    logger.log("Page load completed")
-                    inject_css(browser, config, logger)
-                except Exception as e:
-                    logger.log(f"Warning: Page load wait timed out: {clean_error_message(e)}", "ERROR")
-                
-                # Verify we're not on a blank/transitional page
-                if browser.current_url.startswith('data:'):
-                    logger.log("Warning: URL is not saved correctly for page navigation", "ERROR")
-                
-                return f"Visited URL: {final_url}"
-            
-        if action_type == 'click':
-            clicks = params.get('clicks', [])
-            if not clicks:
-                raise ValueError("Click step must contain a 'clicks' list")
-                    
-            success_count = 0
-            for i, click_params in enumerate(clicks):
-                try:
-                    # Only call wait_for_element once per click attempt
-                    element = wait_for_element(browser, click_params, config, logger)
-                    
-                    try:
-                        element.click()
-                    except Exception as e:
-                        browser.execute_script("arguments[0].click();", element)
-                        
-                    by_strategy, selector = get_element_locator(click_params, config)
-                    logger.log(f"➡️  Clicked element {i+1}: {selector}" , "INFO")
-                    success_count += 1
-                    
-                    # Handle delay between individual clicks
-                    if i < len(clicks) - 1:  # Don't delay after last click
-                        delay = click_params.get('delay_after', config['config'].get('default_delay', 1))
-                        if delay > 0:
-                            logger.log(f"Waiting {delay} seconds between clicks...")
-                            time.sleep(delay)
-                except Exception as click_error:
-                    logger.log(f"Failed to click element {i+1}: {clean_error_message(click_error)}", "ERROR")
-                    continue
-
-            if success_count == 0:
-                raise Exception("All clicks in step failed")
-            elif success_count < len(clicks):
-                return f"Completed {success_count} out of {len(clicks)} clicks"
-            else:
-                return "All clicks completed successfully"
-            
-        elif action_type == 'form':
-            submit_method = params.get('submit_method', 'selenium')
-            for field in params['fields']:
-                element = wait_for_element(browser, field, config, logger)
-                element.clear()  # clear input before filling in
-                element.send_keys(field['value'])
-            submit_button = wait_for_element(browser, {'xpath': params['submit_button']}, config, logger)
-            do_click(submit_button, browser, submit_method) # click the submit button with the specified method
-            return "Form submitted successfully"
-
+            logger.log(f"➡️  Current URL: {browser.current_url}", level="INFO")
+        return action(browser, params, config, logger)
             
     except Exception as e:
         error_msg = clean_error_message(e)
         raise Exception(error_msg)
 
-def perform_sequence(browser, config, event_queue, sequence, logger):
-    """Execute step sequence"""
+def perform_sequence(browser, config, event_queue, sequence, logger, event_waiters=None):
+    """Execute step sequence (event_waiters of the monitor are needed for steps with wait_for_event)"""
     steps_definitions = config['step']
-    default_delay = config['config'].get('default_delay', 1) # default delay is 1 second
+    default_delay = config['_settings'].default_delay
     log_data = []
+    carry_over = deque()  # an event read from the queue for a later step (see process_queued_events)
 
     logger.log(f"\n=== Starting sequence execution ===")
 
@@ -1510,10 +2340,17 @@ def perform_sequence(browser, config, event_queue, sequence, logger):
         step = steps_definitions[step_name]
         is_final_step = i == len(sequence['steps']) - 1
         
-        logger.log(f"\n=== Starting step: {step_name} ===", "INFO")
+        logger.log(f"\n=== Starting step: {step_name} ===", level="INFO")
+        
+        # Register the awaited event before the action, so an event pushed right away is not missed
+        wait_for_event = step.get('wait_for_event')
+        waiter = None
+        if wait_for_event and event_waiters is not None:
+            waiter = event_waiters[wait_for_event] = Event()
         
         try:
-            # Inject CSS before any action (in perform_action there is an additional injection for visit steps after page load)
+            # Fallback for when the CSS couldn't be registered for every new page (register_css) - otherwise a no-op;
+            # perform_visit injects it again after the page load
             inject_css(browser, config, logger)
             
             # Execute the step action
@@ -1525,163 +2362,352 @@ def perform_sequence(browser, config, event_queue, sequence, logger):
             
             # Handle delays based on step type and position
             if is_final_step:
-                logger.log(f"Final step - waiting {delay} seconds for events...", "INFO")
+                logger.log(f"Final step - waiting {delay} seconds for events...", level="INFO")
             else:
-                logger.log(f"Waiting {delay} seconds after {step['type']} step...")
+                logger.log("Waiting %s seconds after %s step...", delay, step['type'])
                 
             if delay > 0:
-                time.sleep(delay)
-                logger.log(f"Delay completed at {datetime.now().strftime('%H:%M:%S')}")
+                if waiter is None:
+                    time.sleep(delay)
+                elif waiter.wait(delay):  # the delay is the longest wait for the event
+                    logger.log(f"Event {wait_for_event} received - delay ended early", level="INFO")
+                else:
+                    logger.log(f"Event {wait_for_event} not received within {delay} seconds", level="ERROR")
+                logger.log("Delay completed", level="DEBUG")  # the log entry has its own timestamp
                 
             # Calculate the cutoff time for events in this step
             step_end_time = datetime.now()
             
             # For the final step, don't use cutoff time
             if is_final_step:
-                process_queued_events(event_queue, log_data, step_name, logger)
+                process_queued_events(event_queue, carry_over, log_data, step_name, logger)
             else:
-                process_queued_events(event_queue, log_data, step_name, logger, step_end_time)
+                process_queued_events(event_queue, carry_over, log_data, step_name, logger, step_end_time)
 
-            logger.log(f"🎉 Step {step_name} completed successfully", "INFO")
+            logger.log(f"🎉 Step {step_name} completed successfully", level="INFO")
                 
         except Exception as e:
             error_msg = clean_error_message(e)
-            logger.log(f"Error in step {step_name}: {error_msg}", "ERROR")
+            logger.log(f"Error in step {step_name}: {error_msg}", level="ERROR")
             log_data.append([
                 step_name,
                 'Error',
-                datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+                time.strftime('%Y-%m-%d %H:%M:%S'),
                 browser.current_url,
                 error_msg,
                 "-",
                 "-"
             ])
+        finally:
+            if waiter is not None:
+                event_waiters.pop(wait_for_event, None)
 
     return log_data
 
 # For better efficiency, cache already compiled regex patterns for validation
-compiled_regex_cache = {}
-
+@functools.lru_cache(maxsize=256)
 def get_compiled_pattern(pattern_str):
     """
     Returns a compiled regex pattern.
-    If the pattern is not already compiled, it compiles it and stores it in the cache.
+    Patterns are compiled once and kept in a bounded LRU cache.
     """
-    if pattern_str not in compiled_regex_cache:
-        compiled_regex_cache[pattern_str] = re.compile(pattern_str)
-    return compiled_regex_cache[pattern_str]
+    return re.compile(pattern_str)
     
-def validate_event(event: Dict[str, Any], rules: Dict[str, Any]) -> Tuple[bool, List[str]]:
+VALIDATION_TYPE_CHECKS = {
+    "int": lambda v: isinstance(v, int) and not isinstance(v, bool),
+    "float": lambda v: isinstance(v, (int, float)),
+    "str": lambda v: isinstance(v, str),
+    "bool": lambda v: isinstance(v, bool),
+}
+
+# Kinds of compiled validation rules
+RULE_PRESENCE = 0       # payload: None - only the key has to exist
+RULE_TYPE = 1           # payload: (type check function, type name)
+RULE_REGEX = 2          # payload: (compiled pattern fullmatch, pattern)
+RULE_INVALID_REGEX = 3  # payload: the original rule string
+RULE_LITERAL = 4        # payload: the expected value
+RULE_OBJECT = 5         # payload: list of compiled child rules
+RULE_LIST = 6           # payload: compiled rule for the list items (key "")
+
+CompiledRule = namedtuple('CompiledRule', ['key', 'required', 'kind', 'payload'])
+
+def compile_validation_rules(rules: Dict[str, Any]) -> List[CompiledRule]:
     """
-    Validates an event based on the provided rules.
+    Compile a validation rule dictionary (as returned by the TOML parser) into a list of CompiledRule,
+    so events are validated without re-interpreting the rules.
     """
-    errors = []
-    
-    type_checks = {
-        "int": lambda v: isinstance(v, int) and not isinstance(v, bool),
-        "float": lambda v: isinstance(v, (int, float)),
-        "str": lambda v: isinstance(v, str),
-        "bool": lambda v: isinstance(v, bool),
-    }
+    return [compile_rule(key.lstrip("!"), key.startswith("!"), expected) for key, expected in rules.items()]
 
+def compile_rule(key, required, expected):
+    """Compile a single rule value - type, regex, literal, nested object or list"""
+    if expected == "" or expected is None:
+        # Empty value - only the presence of the key is checked (together with "!" for required keys)
+        return CompiledRule(key, required, RULE_PRESENCE, None)
     
-    def check_structure(data: Dict[str, Any], rule: Dict[str, Any], path: str = ""):
-        for key, expected in rule.items():
-            required = key.startswith("!")
-            clean_key = key.lstrip("!")
-
-            if clean_key not in data:
-                if required:
-                    errors.append(f"Missing required field: {path}{clean_key}")
-                continue
-
-            value = data[clean_key]
-
-            # Validate basic types
-            if isinstance(expected, str):
-                if expected.lower() in allowed_validation_types:
-                    expected_type = expected.strip('<>').lower()
-                    if expected_type in type_checks and not type_checks[expected_type](value):
-                        errors.append(f"{path}{clean_key} should be a {expected_type}")
-                elif expected.startswith("/"):
-                    expected_first = expected.find('/')
-                    expected_last = expected.rfind('/')
-                    if expected_first == -1 or expected_last <= expected_first:
-                        errors.append(f"{path}{clean_key} has an invalid regex pattern {expected}")
-                    else:
-                        pattern = expected[expected_first+1:expected_last]
-                        compiled_pattern = get_compiled_pattern(pattern)
-                        if not compiled_pattern.fullmatch(str(value)):
-                            errors.append(f"{path}{clean_key} does not match the pattern /{pattern}/")
-                else:
-                    if value != expected:
-                        errors.append(f"{path}{clean_key} = {value} should be '{expected}'")
-
-            elif isinstance(expected, dict):
-                # Validate nested objects
-                if not isinstance(value, dict):
-                    errors.append(f"{path}{clean_key} should be an object")
-                else:
-                    check_structure(value, expected, path + clean_key + ".")
-
-            elif isinstance(expected, list) and expected:
-                # Validate lists with expected structure
-                if not isinstance(value, list):
-                    errors.append(f"{path}{clean_key} should be a list")
-                else:
-                    for i, item in enumerate(value):
-                        check_structure(item, expected[0], f"{path}{clean_key}[{i}].")
-
-    check_structure(event, rules)
+    if isinstance(expected, str):
+        if expected.lower() in allowed_validation_types:
+            expected_type = expected.strip('<>').lower()
+            type_check = VALIDATION_TYPE_CHECKS.get(expected_type)
+            if type_check is None:
+                return CompiledRule(key, required, RULE_PRESENCE, None)
+            return CompiledRule(key, required, RULE_TYPE, (type_check, expected_type))
+        
+        if expected.startswith("/"):
+            expected_first = expected.find('/')
+            expected_last = expected.rfind('/')
+            if expected_first == -1 or expected_last <= expected_first:
+                return CompiledRule(key, required, RULE_INVALID_REGEX, expected)
+            pattern = expected[expected_first+1:expected_last]
+            return CompiledRule(key, required, RULE_REGEX, (get_compiled_pattern(pattern).fullmatch, pattern))
+        
+        return CompiledRule(key, required, RULE_LITERAL, expected)
+    
+    if isinstance(expected, dict):
+        return CompiledRule(key, required, RULE_OBJECT, compile_validation_rules(expected))
+    
+    if isinstance(expected, list) and expected:
+        # Every list item is checked against the first rule in the list
+        return CompiledRule(key, required, RULE_LIST, compile_rule("", False, expected[0]))
+    
+    # Other values (numbers, booleans, empty lists) are not checked
+    return CompiledRule(key, required, RULE_PRESENCE, None)
+
+def run_validation_rules(data, rules, path, errors):
+    """Walk compiled validation rules over the data, appending error messages to errors"""
+    for rule in rules:
+        key = rule.key
+        if key not in data:
+            if rule.required:
+                errors.append(f"Missing required field: {path}{key}")
+            continue
+        if rule.kind:
+            check_rule_value(data[key], rule, path, errors)
+
+def check_rule_value(value, rule, path, errors):
+    """Check a single value against a compiled rule (anything except RULE_PRESENCE)"""
+    kind = rule.kind
+    key = rule.key
+    if kind == RULE_TYPE:
+        type_check, expected_type = rule.payload
+        if not type_check(value):
+            errors.append(f"{path}{key} should be a {expected_type}")
+    elif kind == RULE_REGEX:
+        fullmatch, pattern = rule.payload
+        if not fullmatch(str(value)):
+            errors.append(f"{path}{key} does not match the pattern /{pattern}/")
+    elif kind == RULE_LITERAL:
+        if value != rule.payload:
+            errors.append(f"{path}{key} = {value} should be '{rule.payload}'")
+    elif kind == RULE_OBJECT:
+        # Validate nested objects
+        if not isinstance(value, dict):
+            errors.append(f"{path}{key} should be an object")
+        else:
+            run_validation_rules(value, rule.payload, f"{path}{key}.", errors)
+    elif kind == RULE_LIST:
+        # Validate lists with expected structure
+        if not isinstance(value, list):
+            errors.append(f"{path}{key} should be a list")
+            return
+        item_rule = rule.payload
+        if not item_rule.kind:
+            return
+        for i, item in enumerate(value):
+            check_rule_value(item, item_rule, f"{path}{key}[{i}]", errors)
+    elif kind == RULE_INVALID_REGEX:
+        errors.append(f"{path}{key} has an invalid regex pattern {rule.payload}")
+
+def validate_event(event: Dict[str, Any], rules) -> Tuple[bool, List[str]]:
+    """
+    Validates an event based on the provided rules.
+    Rules are either compiled with compile_validation_rules or a raw rule dictionary (compiled on the fly).
+    """
+    if not rules:  # nothing to check
+        return (True, [])
+    if isinstance(rules, dict):
+        rules = compile_validation_rules(rules)
+    
+    errors = []
+    run_validation_rules(event, rules, "", errors)
     
     return (len(errors) == 0, errors)
 
 def get_output_folder(config, logger):
     """  Get and create output folder if it doesn't exist. """
-    # Get output folder from config, default to "." (current directory)
-    output_folder = config['config'].get('output_folder', '.')
+    # The folder is resolved and created once per run, later saves reuse it
+    cached_folder = config.get('_output_folder')
+    if cached_folder is not None:
+        return cached_folder
+    
+    # Get output folder from config, default to "." (current directory) - "~" stands for the user's home directory
+    output_folder = os.path.expanduser(os.fspath(config['config'].get('output_folder', '.')))
     
     try:
-        # Handle Windows paths with single backslashes by using raw string
-        if isinstance(output_folder, str):
-            output_folder = rf"{output_folder}"
+        # Convert relative path to absolute (relative paths start at the config file's directory)
+        if not os.path.isabs(output_folder):
+            config_dir = os.path.dirname(os.path.abspath(config['_config_file_path']))
+            output_folder = os.path.join(config_dir, output_folder)
         
-        # Convert to Path object for cross-platform handling
+        # Create folder if it doesn't exist (on later runs it usually does, so check first)
+        if not os.path.isdir(output_folder):
+            os.makedirs(output_folder, exist_ok=True)
         folder_path = Path(output_folder)
-        
-        # Convert relative path to absolute
-        if not folder_path.is_absolute():
-            config_dir = Path(config['_config_file_path']).parent
-            folder_path = config_dir / folder_path
-        
-        # Create folder if it doesn't exist
-        folder_path.mkdir(parents=True, exist_ok=True)
         logger.log(f"Output folder confirmed: {folder_path}")
+        config['_output_folder'] = folder_path
         
-    except Exception as e:
-        logger.log(f"Error creating output folder: {clean_error_message(e)}", "ERROR")
+    except OSError as e:
+        logger.log(f"Error creating output folder: {clean_error_message(e)}", level="ERROR")
         # Fall back to script directory
         folder_path = Path().absolute()
-        logger.log(f"Using fallback output folder: {folder_path}", "INFO")
+        logger.log(f"Using fallback output folder: {folder_path}", level="INFO")
     
     return folder_path
 
-def save_results(config, logger, log_data, debug_logs=None):
+# Writers reused between saves of the same config: (output destination, config file path) -> writer
+_WRITERS = {}
+
+def get_writer(output_destination, config, logger):
+    """Return the writer for the destination, creating it on first use"""
+    key = (output_destination, config.get('_config_file_path'))
+    writer = _WRITERS.get(key)
+    if writer is None:
+        if output_destination == 'google_sheets':
+            writer_class = GoogleSheetsWriter
+        else:
+            writer_class = FastXlsxWriter if config['config'].get('fast_xlsx', False) else ExcelWriter
+        writer = _WRITERS.setdefault(key, writer_class(config, logger))
+    return writer
+
+def save_results(config, logger, log_data, debug_logs=None, output_destination=None):
     """Save results to configured destination"""
-    output_destination = config['config'].get('output_destination', 'excel')
+    if output_destination is None:
+        output_destination = config['config'].get('output_destination', 'excel')
     
     if output_destination == 'google_sheets':
         try:
-            writer = GoogleSheetsWriter(config, logger)
+            writer = get_writer('google_sheets', config, logger)
             return writer.save_data(log_data, debug_logs)
         except Exception as e:
-            logger.log(f"Warning: Saving to Google Sheets failed with error: {str(e)}.\nSaving results in Excel file instead", "WARNING")
-            writer = ExcelWriter(config, logger)
+            logger.log(f"Warning: Saving to Google Sheets failed with error: {str(e)}.\nSaving results in Excel file instead", level="WARNING")
+            writer = get_writer('excel', config, logger)
             return writer.save_data(log_data, debug_logs)
     else:
-        writer = ExcelWriter(config, logger)
+        writer = get_writer('excel', config, logger)
         return writer.save_data(log_data, debug_logs)
 
+def close_browser(browser, logger):
+    """Quit the browser, without waiting on a driver that is no longer running"""
+    driver_process = getattr(getattr(browser, 'service', None), 'process', None)
+    if driver_process is not None and driver_process.poll() is not None:
+        # The driver has already exited - quit() would only wait for the command timeout
+        logger.log("Browser driver is no longer running, skipping quit", level="WARNING")
+        return
+    try:
+        browser.quit()
+    except Exception as e:
+        logger.log(f"Could not quit the browser cleanly: {clean_error_message(e)}", level="WARNING")
+        if driver_process is not None:
+            driver_process.kill()
+
+class DataLayerMonitor:
+    """dataLayer monitoring thread for a browser, started once and shared by all sequences run in it"""
+    def __init__(self, browser, config, logger):
+        self.event_queue = Queue(maxsize=config['config'].get('event_queue_max', 10000))  # bounded, so a busy page can't outgrow memory
+        self.stop_event = Event()
+        self.event_waiters = {}  # event name -> Event set when the monitor queues that event (see wait_for_event)
+        self.reset_request = Event()
+        self.reset_done = Event()
+        self.thread = Thread(
+            target=start_monitoring_thread,
+            args=(browser, config['_settings'].track_events, self.event_queue, self.stop_event, logger, config,
+                  self.event_waiters, self.reset_request, self.reset_done)
+        )
+        self.thread.daemon = True
+        self.thread.start()
+        
+    def discard_pending(self):
+        """Drop events queued after the previous sequence finished - they don't belong to the next one"""
+        while True:
+            try:
+                self.event_queue.get_nowait()
+            except Empty:
+                break
+                
+    def reset(self):
+        """
+        Start a new sequence: clear the deduplication window in the monitoring thread (waiting until it's done,
+        so the poll in progress finishes first), then drop the events queued so far
+        """
+        self.reset_done.clear()
+        self.reset_request.set()
+        self.reset_done.wait(5)  # the thread checks the request before each poll
+        self.discard_pending()
+    
+    def stop(self):
+        """Stop the monitoring thread and wait for it to finish"""
+        self.stop_event.set()
+        self.thread.join()
+
+def run_sequence(browser, config, sequence_name, sequence, logger, monitor):
+    """Execute a single sequence in the given browser, collecting events from the browser's monitor"""
+    monitor.reset()
+    seed_sequence_random(config, sequence_name)
+    return perform_sequence(browser, config, monitor.event_queue, sequence, logger, monitor.event_waiters)
+
+def run_sequences_in_parallel(config, logger, workers_count):
+    """Execute sequences with several browsers at once, returning results in the configured order"""
+    logger.log(f"Running sequences in {workers_count} parallel browsers", level="INFO")
+    worker_state = threading.local()  # each worker thread keeps its own browser - drivers are not thread-safe
+    browsers = []  # (browser, monitor) of all workers
+    browsers_lock = Lock()
+    
+    def run_in_worker(sequence_name, sequence):
+        browser = getattr(worker_state, 'browser', None)
+        if browser is None:
+            seed_sequence_random(config, f"browser:{sequence_name}")  # repeatable user agent of the worker's browser
+            try:
+                browser = initialize_browser(config, logger)
+            except SystemExit:
+                # initialize_browser exits on failure, which must not end a worker thread silently
+                raise Exception(f"Browser could not be started for sequence {sequence_name}")
+            worker_state.browser = browser
+            worker_state.monitor = DataLayerMonitor(browser, config, logger)
+            with browsers_lock:
+                browsers.append((browser, worker_state.monitor))
+        logger.log(f"=== Starting sequence: {sequence_name} ===", level="INFO")
+        return run_sequence(browser, config, sequence_name, sequence, logger, worker_state.monitor)
+    
+    results = {}
+    try:
+        with ThreadPoolExecutor(max_workers=workers_count, thread_name_prefix="sequence") as executor:
+            futures = {
+                executor.submit(run_in_worker, sequence_name, sequence): sequence_name
+                for sequence_name, sequence in config['sequence'].items()
+            }
+            for future in as_completed(futures):
+                sequence_name = futures[future]
+                try:
+                    results[sequence_name] = future.result()
+                except Exception as e:
+                    # Other sequences keep running - the failed one gets an error row in its sheet instead of events
+                    error_msg = clean_error_message(e)
+                    logger.log(f"Error in sequence {sequence_name}: {error_msg}", level="ERROR")
+                    results[sequence_name] = [[
+                        sequence_name,
+                        'Error',
+                        time.strftime('%Y-%m-%d %H:%M:%S'),
+                        '',
+                        error_msg,
+                        "-",
+                        "-"
+                    ]]
+    finally:
+        for browser, monitor in browsers:
+            monitor.stop()
+            close_browser(browser, logger)
+    
+    return [(name, results[name]) for name in config['sequence']]
+
 def main(debug_prints=False):
     """Main execution function with optional debug printing"""
     print(PROJECT_HEADER)
@@ -1697,74 +2723,67 @@ def main(debug_prints=False):
     logger = LogCollector()
     config = load_config(config_path, logger)
     config['_config_file_path'] = config_path
+    cfg = config['config']
+    debug_mode = cfg.get('debug_mode', False)
+    output_destination = cfg.get('output_destination', 'excel')
+    logger.set_max_entries(cfg.get('max_log_entries', 100000))
+    if not debug_mode:
+        # Debug logs are only saved in debug mode - don't collect (or format) them otherwise
+        logger.collect = False
+        logger.logs.clear()
     
     browser = None
-    log_data = {}  # Dictionary to store data for each sequence
+    monitor = None
+    log_data = []  # (sequence name, sequence data) for each sequence, in the configured order
     
     try:
         if debug_prints:
-            logger.log("Initializing OMDL...", "INFO")
-        browser = initialize_browser(config, logger)
-        
-        # Process each sequence
-        for sequence_name, sequence in config['sequence'].items():
-            if debug_prints:
-                logger.log(f"=== Starting sequence: {sequence_name} ===", "INFO")
-            
-            # Create thread communication objects for this sequence
-            event_queue = Queue()
-            stop_monitoring = Event()
-            
-            # Start monitoring thread
-            monitored_events = config['config']['track_events']
-            monitor_thread = Thread(
-                target=start_monitoring_thread,
-                args=(browser, monitored_events, event_queue, stop_monitoring, logger, config)
-            )
-            monitor_thread.daemon = True
-            monitor_thread.start()
-            
-            # Execute step sequence
-            sequence_data = perform_sequence(browser, config, event_queue, sequence, logger)
-            log_data[sequence_name] = sequence_data  # Store sequence data
-            
-            # Stop monitoring for this sequence
-            stop_monitoring.set()
-            monitor_thread.join()
+            logger.log("Initializing OMDL...", level="INFO")
+        parallel_sequences = min(cfg.get('parallel_sequences', 1), len(config['sequence']))
+        if parallel_sequences > 1:
+            # Sequences are independent, so they can be spread over several browsers
+            log_data = run_sequences_in_parallel(config, logger, parallel_sequences)
+        else:
+            seed_sequence_random(config, "browser")  # repeatable user agent
+            browser = initialize_browser(config, logger)
+            monitor = DataLayerMonitor(browser, config, logger)  # one monitoring thread for all sequences
             
-        # Save results
-        output_path = save_results(config, logger, log_data, 
-                                 logger.get_logs() if config['config'].get('debug_mode', False) else None)
-        if debug_prints:
-            logger.log(f"Results saved to: {output_path}", "INFO")
+            # Process each sequence
+            for sequence_name, sequence in config['sequence'].items():
+                if debug_prints:
+                    logger.log(f"=== Starting sequence: {sequence_name} ===", level="INFO")
+                log_data.append((sequence_name, run_sequence(browser, config, sequence_name, sequence, logger, monitor)))  # Store sequence data
             
     except Exception as e:
         error_msg = clean_error_message(e)
         if debug_prints:
-            logger.log(f"Critical error: {error_msg}", "ERROR")
-        # Create error data
+            logger.log(f"Critical error: {error_msg}", level="ERROR")
+        # Add error data next to the sequences completed before the error
         error_data = [
             ['FATAL_ERROR', 'Script Error', 
-             datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+             time.strftime('%Y-%m-%d %H:%M:%S'),
              '', error_msg]
         ]
-        log_data = {'Errors': error_data}
-        
-        try:
-            # Try to save error information
-            output_path = save_results(config, logger, log_data, 
-                                     logger.get_logs() if config['config'].get('debug_mode', False) else None)
-            if debug_prints:
-                logger.log(f"Error information saved to: {output_path}")
-        except Exception as save_error:
-            if debug_prints:
-                print(f"Could not save error information: {clean_error_message(save_error)}")
+        log_data.append(('Errors', error_data))
             
     finally:
+        # Save results (with errors, if any) in a single write
+        if log_data:
+            try:
+                output_path = save_results(config, logger, log_data, 
+                                         logger.get_logs() if debug_mode else None,
+                                         output_destination=output_destination)
+                if debug_prints:
+                    logger.log(f"Results saved to: {output_path}", level="INFO")
+            except Exception as save_error:
+                if debug_prints:
+                    print(f"Could not save results: {clean_error_message(save_error)}")
+        if monitor:
+            monitor.stop()
         if browser:
-            browser.quit()
+            close_browser(browser, logger)
         if debug_prints:
-            logger.log("\n🎉🎉🎉 Done! 🎉🎉🎉", "INFO")
+            logger.log("\n🎉🎉🎉 Done! 🎉🎉🎉", level="INFO")
 
 # start
 if __name__ == "__main__":